@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""Single-pass Next.js routing fixer shared by the fix_* scripts.
+
+Every rule is folded into one compiled alternation, so each source file is
+read once, scanned once and written at most once no matter how many rules
+apply. Running this script directly applies the full clean-up; the older
+fix_routing_errors.py, fix_routing_corrected.py and fix_template_literals.py
+scripts are thin wrappers that select a subset of RULES.
+"""
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
+
+APP_DIR = "/workspace/tailoring-management-platform"
+
+# Build output and dependency trees never need fixing
+SKIP_DIRS = {'node_modules', '.next', '.git', 'dist', 'build', 'out', '.turbo'}
+
+# name -> (pattern, prefilter token, replacement prefix, replacement suffix)
+# Each pattern captures the URL in a single group named after the rule; a
+# match is replaced by prefix + captured URL + suffix.
+RULES = {
+    # {${/path}} -> /path (left behind by fix_routing_errors.py)
+    'malformed': (
+        rb'\{\$\{(?P<malformed>/[^{}]+)\}\}',
+        b'${/',
+        b'',
+        b'',
+    ),
+    # ${/path} -> /path
+    'template_path': (
+        rb'\$\{(?P<template_path>/[^}]+)\}',
+        b'${/',
+        b'',
+        b'',
+    ),
+    # href="/path" -> href={`/path`}
+    'href': (
+        rb'href="(?P<href>/[^"]*)"',
+        b'href="/',
+        b'href={`',
+        b'`}',
+    ),
+    # router.push('/path') -> router.push(`/path`)
+    'push': (
+        rb"router\.push\('(?P<push>[^']+)'\)",
+        b"router.push('",
+        b'router.push(`',
+        b'`)',
+    ),
+    # href={`/path/${variable}/path`} -> href={`${/path/${variable}/path}`}
+    'href_template': (
+        rb'href=\{`(?P<href_template>/[^`]*\$\{[^}]*\}[^`]*)`\}',
+        b'href={`/',
+        b'href={`${',
+        b'}`}',
+    ),
+    # href="/path" -> href={`${/path}`}
+    'href_string': (
+        rb'href="(?P<href_string>/[^"]*)"',
+        b'href="/',
+        b'href={`${',
+        b'}`}',
+    ),
+    # router.push('/path') -> router.push(`$/path`)
+    'push_string': (
+        rb"router\.push\('(?P<push_string>[^']+)'\)",
+        b"router.push('",
+        b'router.push(`$',
+        b'`)',
+    ),
+    # router.push(`/path/${variable}`) -> router.push(`$/path/${variable}`)
+    'push_template': (
+        rb"router\.push\(`(?P<push_template>[^`]*\$\{[^}]*\}[^`]*)`\)",
+        b'router.push(`',
+        b'router.push(`$',
+        b'`)',
+    ),
+}
+
+# Rules applied when this script is run directly: repair everything to the
+# final href={`/path`} / router.push(`/path`) form.
+DEFAULT_RULES = ('malformed', 'template_path', 'href', 'push')
+
+# Files larger than this are scanned through a read-only mmap rather than
+# being copied into a bytes object first
+MMAP_THRESHOLD = 64 * 1024
+
+# Larger files are skipped; hand-written .ts/.tsx is far smaller, and regex
+# passes over minified bundles or generated types can take very long
+MAX_FILE_SIZE = 512 * 1024
+
+# Source file lists from previous runs, reused while no directory has changed
+CACHE_FILE = Path(__file__).with_name('.fixer_cache.json')
+
+# Threads writing fixed files back while the workers keep scanning
+WRITE_WORKERS = 4
+
+# Digests of contents already scanned without a match (per worker process);
+# byte-identical files such as barrel re-exports are only scanned once.
+_seen_clean = set()
+
+
+class Fixer:
+    """A compiled set of RULES applied to files in a single pass"""
+
+    def __init__(self, *names):
+        self.names = names
+        self.pattern = re.compile(b'|'.join(RULES[name][0] for name in names))
+        # Cheap substring checks; a file containing none of these cannot match
+        self.tokens = tuple(dict.fromkeys(RULES[name][1] for name in names))
+        # (prefix, suffix) indexed by group number, so a match is rebuilt
+        # without a replacement template or a per-match callback
+        self.affixes = [None] * (self.pattern.groups + 1)
+        for name, index in self.pattern.groupindex.items():
+            self.affixes[index] = RULES[name][2:]
+
+    def rewrite(self, content):
+        """Return content with the rules applied, or None if nothing matched"""
+        if not any(content.find(token) != -1 for token in self.tokens):
+            return None
+
+        key = (self.names, hashlib.blake2b(content, digest_size=16).digest())
+        if key in _seen_clean:
+            return None
+
+        # Splice replacements into a bytearray so only the matched regions
+        # are rebuilt; a file without matches allocates nothing
+        affixes = self.affixes
+        output = None
+        last = 0
+        with memoryview(content) as view:
+            for match in self.pattern.finditer(content):
+                if output is None:
+                    output = bytearray()
+                index = match.lastindex
+                prefix, suffix = affixes[index]
+                start, end = match.span(index)
+                output += view[last:match.start()]
+                output += prefix
+                output += view[start:end]
+                output += suffix
+                last = match.end()
+            if output is None:
+                _seen_clean.add(key)
+                return None
+            output += view[last:]
+
+        return output
+
+    def process_file(self, file_path):
+        """Read one file and apply the rules.
+
+        Returns (content, message): the new content, or None if the file is
+        unchanged or could not be read, and a line to report for a skipped or
+        unreadable file, else None. Writing and printing are left to the
+        caller so writes overlap with scanning and output stays batched.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > MAX_FILE_SIZE:
+                    return None, f"Skipping {file_path}: {size} bytes is over MAX_FILE_SIZE"
+                if size > MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        return self.rewrite(mapped), None
+                return self.rewrite(f.read()), None
+
+        except Exception as e:
+            return None, f"Error processing {file_path}: {e}"
+
+
+def iter_source_files(root, suffixes=('.tsx', '.ts'), dir_mtimes=None):
+    """Yield source files under root in a single os.walk pass.
+
+    When dir_mtimes is given, the mtime of every directory visited is
+    recorded in it so the listing can be cached.
+    """
+    for dirpath, dirs, filenames in os.walk(root):
+        if dir_mtimes is not None:
+            dir_mtimes[dirpath] = os.stat(dirpath).st_mtime_ns
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith('.')]
+        for filename in filenames:
+            if filename.endswith(suffixes) and not filename.startswith('.'):
+                yield os.path.join(dirpath, filename)
+
+
+def _load_cache():
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _dir_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _dirs_unchanged(dir_mtimes):
+    # Adding or removing an entry anywhere in the tree bumps the mtime of
+    # its parent directory, so matching mtimes mean the listing still holds.
+    # Roots that did not exist are recorded as None and must still be
+    # missing; an empty map proves nothing.
+    if not dir_mtimes:
+        return False
+    try:
+        return all(_dir_mtime(path) == mtime for path, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def list_source_files(subdirs=("app", "components"), suffixes=('.tsx', '.ts')):
+    """Return the source files under APP_DIR/subdirs.
+
+    The listing is cached in CACHE_FILE and reused on the next run as long
+    as none of the walked directories has been modified since and no
+    missing subdir has been created.
+    """
+    key = '|'.join((APP_DIR, ','.join(subdirs), ','.join(suffixes)))
+    cache = _load_cache()
+    entry = cache.get(key)
+    if entry and _dirs_unchanged(entry['dirs']):
+        return entry['files']
+
+    # Walk each tree once: drop repeated subdirs and ones nested in another
+    roots = sorted({os.path.normpath(f"{APP_DIR}/{subdir}") for subdir in subdirs})
+    roots = [
+        root for root in roots
+        if not any(root.startswith(other + os.sep) for other in roots)
+    ]
+
+    # Record missing roots before walking, so one created meanwhile is
+    # noticed on the next run
+    dir_mtimes = {root: None for root in roots if _dir_mtime(root) is None}
+    files = list(chain.from_iterable(
+        iter_source_files(root, suffixes, dir_mtimes) for root in roots
+    ))
+
+    cache[key] = {'dirs': dir_mtimes, 'files': files}
+    try:
+        CACHE_FILE.write_text(json.dumps(cache), encoding='utf-8')
+    except OSError as e:
+        print(f"Could not write file list cache {CACHE_FILE}: {e}")
+
+    return files
+
+
+def fix_files(fixer, subdirs=("app", "components"), suffixes=('.tsx', '.ts')):
+    """Run fixer over every source file under APP_DIR/subdirs in parallel.
+
+    Returns the paths of the files that were rewritten, in walk order, and
+    the messages for files that were skipped or failed, for report().
+    """
+    files = list_source_files(subdirs, suffixes)
+
+    messages = []
+    writes = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, \
+            ThreadPoolExecutor(max_workers=WRITE_WORKERS) as writer:
+        results = executor.map(fixer.process_file, files, chunksize=32)
+        for file_path, (content, message) in zip(files, results):
+            if message is not None:
+                messages.append(message)
+            if content is not None:
+                writes.append((file_path, writer.submit(Path(file_path).write_bytes, content)))
+
+    fixed = []
+    for file_path, write in writes:
+        try:
+            write.result()
+        except Exception as e:
+            messages.append(f"Error processing {file_path}: {e}")
+        else:
+            fixed.append(file_path)
+    return fixed, messages
+
+
+def report(fixed, summary, messages=()):
+    """Print messages, a Fixed: line per path and summary in one stdout write"""
+    lines = [f"{message}\n" for message in messages]
+    lines.extend(f"Fixed: {file_path}\n" for file_path in fixed)
+    lines.append(f"{summary}\n")
+    sys.stdout.write(''.join(lines))
+
+
+def fix_all():
+    """Apply every routing and template-literal fix in one pass per file"""
+    fixed, messages = fix_files(Fixer(*DEFAULT_RULES))
+    report(fixed, f"\nTotal files fixed: {len(fixed)}", messages)
+
+
+if __name__ == "__main__":
+    fix_all()
@@ -5,34 +5,112 @@ Real-time incident notification and escalation management
 """
 
 import json
-import smtplib
-import requests
 import logging
-import schedule
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Callable, NamedTuple, Tuple
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import threading
 import queue
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
-from email.mime.base import MimeBase
-from email import encoders
+import bisect
+from collections import Counter
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
+import heapq
+import itertools
 import os
+import sys
+import string
+from types import MappingProxyType
+
+# Channel libraries are imported by the handlers that use them, so an
+# instance that never sends email or webhooks does not load them
+if TYPE_CHECKING:
+    import smtplib
+    import requests
+
+# Shared helpers live in the incident-response directory, which is not on
+# the path when this module is run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from json_utils import dumps_json
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SMTP session pool: at most SMTP_POOL_SIZE sessions are open at once, each
+# is closed after SMTP_IDLE_TIMEOUT idle seconds and recycled after
+# SMTP_MAX_MESSAGES_PER_CONNECTION messages
+SMTP_POOL_SIZE = 5
+SMTP_IDLE_TIMEOUT = 100
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+SMTP_CHECKOUT_TIMEOUT = 60
+
+# Alert ingest: create_alert only enqueues; dispatcher threads drain up to
+# ALERT_BATCH_SIZE alerts at a time and send one message per channel
+ALERT_QUEUE_SIZE = 10000
+ALERT_BATCH_SIZE = 50
+DISPATCH_WORKERS = 4
+
+# Threads sending to the channels of a batch concurrently, so a batch takes
+# as long as its slowest channel rather than the sum of all of them
+CHANNEL_WORKERS = 16
+
+# Keep-alive connections per host for webhook notifications (Slack, Teams,
+# PagerDuty); throttled or gateway-failed posts are retried with backoff
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+HTTP_RETRIES = 2
+
+# Seconds before an alert that reached no channel is sent again
+ALERT_RETRY_DELAY = 300
+
+# Identical alerts (same title, source and metadata) raised within this many
+# seconds of the first one are merged into it instead of notifying again
+DEDUP_WINDOW = 300
+
+# Active alerts are split across this many independently locked dicts so
+# concurrent create/acknowledge/resolve calls rarely contend
+ACTIVE_ALERT_SHARDS = 8
+
+# Resolved alerts kept in alert_history unless alerting.history_max is set;
+# once full, the oldest 1/ALERT_HISTORY_TRIM of them are dropped at once
+ALERT_HISTORY_MAX = 100_000
+ALERT_HISTORY_TRIM = 16
+
 class AlertSeverity(Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
+# Lowest to highest, for picking the most severe alert in a batch
+SEVERITY_ORDER = [AlertSeverity.LOW, AlertSeverity.MEDIUM, AlertSeverity.HIGH, AlertSeverity.CRITICAL]
+
+SEVERITY_EMOJI = {
+    AlertSeverity.CRITICAL: "🔴",
+    AlertSeverity.HIGH: "🟠",
+    AlertSeverity.MEDIUM: "🟡",
+    AlertSeverity.LOW: "🔵"
+}
+
+SEVERITY_COLORS = {
+    AlertSeverity.CRITICAL: "#d32f2f",
+    AlertSeverity.HIGH: "#f57c00",
+    AlertSeverity.MEDIUM: "#fbc02d",
+    AlertSeverity.LOW: "#1976d2"
+}
+
+SLACK_COLORS = {
+    AlertSeverity.CRITICAL: "danger",
+    AlertSeverity.HIGH: "warning",
+    AlertSeverity.MEDIUM: "good",
+    AlertSeverity.LOW: "#439FE0"
+}
+
 class AlertStatus(Enum):
     NEW = "new"
     SENT = "sent"
@@ -48,7 +126,42 @@ class NotificationChannel(Enum):
     PAGERDUTY = "pagerduty"
     WEBHOOK = "webhook"
 
-@dataclass
+class EscalationRule(NamedTuple):
+    """How an alert of a given severity is notified and escalated"""
+    initial_channels: Tuple[NotificationChannel, ...]
+    escalation_timeout: int  # seconds
+    escalation_channels: Tuple[NotificationChannel, ...]
+    max_level: int
+
+# How each severity is notified and escalated
+ESCALATION_RULES = MappingProxyType({
+    AlertSeverity.CRITICAL: EscalationRule(
+        initial_channels=(NotificationChannel.EMAIL, NotificationChannel.SLACK, NotificationChannel.PAGERDUTY),
+        escalation_timeout=300,  # 5 minutes
+        escalation_channels=(NotificationChannel.SMS, NotificationChannel.TEAMS),
+        max_level=3
+    ),
+    AlertSeverity.HIGH: EscalationRule(
+        initial_channels=(NotificationChannel.EMAIL, NotificationChannel.SLACK),
+        escalation_timeout=900,  # 15 minutes
+        escalation_channels=(NotificationChannel.PAGERDUTY,),
+        max_level=2
+    ),
+    AlertSeverity.MEDIUM: EscalationRule(
+        initial_channels=(NotificationChannel.EMAIL,),
+        escalation_timeout=1800,  # 30 minutes
+        escalation_channels=(NotificationChannel.SLACK,),
+        max_level=1
+    ),
+    AlertSeverity.LOW: EscalationRule(
+        initial_channels=(NotificationChannel.EMAIL,),
+        escalation_timeout=3600,  # 1 hour
+        escalation_channels=(),
+        max_level=0
+    )
+})
+
+@dataclass(slots=True)
 class Alert:
     """Represents a security alert"""
     id: str
@@ -64,31 +177,104 @@ class Alert:
     channels: List[NotificationChannel]
     retry_count: int = 0
     last_attempt: Optional[datetime] = None
+    # time.monotonic() of last_attempt, for retry and escalation timeouts
+    last_attempt_mono: Optional[float] = None
     acknowledged_at: Optional[datetime] = None
     resolved_at: Optional[datetime] = None
     incident_id: Optional[str] = None
+    fingerprint: Optional[str] = None
+    # Duplicates merged into this alert; kept out of metadata so the
+    # fingerprint of the original event does not change
+    occurrences: int = 1
+    last_occurrence: Optional[datetime] = None
+    # Rendered "Additional Information" email block; code that changes
+    # metadata must reset it to None
+    metadata_html: Optional[str] = field(default=None, repr=False, compare=False)
+    
+    def __hash__(self):
+        # Alert ids are unique, so hashing never needs the other fields
+        return hash(self.id)
+
+@dataclass
+class PooledSMTP:
+    """An SMTP session owned by the AlertManager email pool"""
+    conn: "smtplib.SMTP"
+    messages_sent: int = 0
+    last_used: float = 0.0
 
 class AlertManager:
     """Manages alert creation, routing, and escalation"""
     
     def __init__(self, config_path: str = "config/incident-config.json"):
         self.config = self._load_config(config_path)
-        self.active_alerts = {}
+        
+        # Active alerts as (alerts by id, lock) shards; see _shard
+        self._shards = [({}, threading.Lock()) for _ in range(ACTIVE_ALERT_SHARDS)]
+        
+        # Resolved alerts ordered by creation time, with their timestamps
+        # as epoch seconds in the parallel _history_ts list for bisecting;
+        # the oldest are dropped once history_max is reached
+        self._history_max = self.config.get("alerting", {}).get("history_max", ALERT_HISTORY_MAX)
         self.alert_history = []
+        self._history_ts = []
+        
+        # Running totals so get_statistics never scans alert_history:
+        # by_status covers active alerts; by_severity and resolved cover
+        # alert_history and shrink when alerts are dropped from it;
+        # acknowledged counts every acknowledgment since startup.
+        # _counts_lock also guards alert_history and _history_ts.
+        self._counts = {
+            "by_severity": Counter(),
+            "by_status": Counter(),
+            "resolved": 0,
+            "acknowledged": 0
+        }
+        self._counts_lock = threading.Lock()
         self.notification_handlers = {}
-        self.escalation_rules = self._load_escalation_rules()
         self.acknowledgment_callbacks = []
         self.resolution_callbacks = []
         
+        # Pool of reusable SMTP sessions for email alerts; the semaphore caps
+        # sessions in use so the pool never holds more than SMTP_POOL_SIZE
+        self._smtp_pool = queue.LifoQueue(maxsize=SMTP_POOL_SIZE)
+        self._smtp_slots = threading.BoundedSemaphore(SMTP_POOL_SIZE)
+        
+        # Shared HTTP session so webhook posts reuse TCP/TLS connections;
+        # created by _get_http_session on the first post
+        self._http = None
+        self._http_lock = threading.Lock()
+        
+        # Background jobs share one scheduler thread driven by a min-heap of
+        # (due monotonic time, sequence, job, args)
+        self._timers = []
+        self._timer_seq = itertools.count()
+        self._timer_cv = threading.Condition()
+        self._running = True
+        self._scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
+        self._scheduler_thread.start()
+        
         # Setup notification handlers
         self._setup_notification_handlers()
         
+        # Fingerprint -> (alert id, monotonic time first seen) for dedup,
+        # guarded by one of several locks picked by fingerprint hash
+        self._fingerprints = {}
+        self._dedup_locks = [threading.Lock() for _ in range(ACTIVE_ALERT_SHARDS)]
+        
+        self._channel_pool = ThreadPoolExecutor(max_workers=CHANNEL_WORKERS, thread_name_prefix="notif")
+        
+        # Bounded ingest queue drained in batches by the dispatcher threads
+        self._ingest_queue = queue.Queue(maxsize=ALERT_QUEUE_SIZE)
+        self._dispatch_threads = [
+            threading.Thread(target=self._dispatch_alerts, daemon=True)
+            for _ in range(DISPATCH_WORKERS)
+        ]
+        for thread in self._dispatch_threads:
+            thread.start()
+        
         # Start alert processing
         self._start_alert_processor()
         
-        # Start escalation scheduler
-        self._start_escalation_scheduler()
-        
         logger.info("Alert Manager initialized")
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
@@ -128,35 +314,6 @@ class AlertManager:
             }
         }
     
-    def _load_escalation_rules(self) -> Dict[str, Any]:
-        """Load escalation rules from configuration"""
-        return {
-            "critical": {
-                "initial_channels": [NotificationChannel.EMAIL, NotificationChannel.SLACK, NotificationChannel.PAGERDUTY],
-                "escalation_timeout": 300,  # 5 minutes
-                "escalation_channels": [NotificationChannel.SMS, NotificationChannel.TEAMS],
-                "max_level": 3
-            },
-            "high": {
-                "initial_channels": [NotificationChannel.EMAIL, NotificationChannel.SLACK],
-                "escalation_timeout": 900,  # 15 minutes
-                "escalation_channels": [NotificationChannel.PAGERDUTY],
-                "max_level": 2
-            },
-            "medium": {
-                "initial_channels": [NotificationChannel.EMAIL],
-                "escalation_timeout": 1800,  # 30 minutes
-                "escalation_channels": [NotificationChannel.SLACK],
-                "max_level": 1
-            },
-            "low": {
-                "initial_channels": [NotificationChannel.EMAIL],
-                "escalation_timeout": 3600,  # 1 hour
-                "escalation_channels": [],
-                "max_level": 0
-            }
-        }
-    
     def _setup_notification_handlers(self):
         """Setup notification channel handlers"""
         self.notification_handlers = {
@@ -167,50 +324,60 @@ class AlertManager:
             NotificationChannel.PAGERDUTY: self._send_pagerduty_alert,
             NotificationChannel.WEBHOOK: self._send_webhook_alert
         }
+        # Channels that can deliver a whole batch of alerts in one message
+        self.batch_notification_handlers = {
+            NotificationChannel.EMAIL: self._send_email_batch,
+            NotificationChannel.SLACK: self._send_slack_batch
+        }
     
-    def _start_alert_processor(self):
-        """Start background alert processing thread"""
-        def process_alerts():
-            while True:
-                try:
-                    # Process pending alerts
-                    self._process_pending_alerts()
-                    
-                    # Retry failed alerts
-                    self._retry_failed_alerts()
-                    
-                    time.sleep(10)  # Process every 10 seconds
-                    
-                except Exception as e:
-                    logger.error(f"Error in alert processor: {e}")
-                    time.sleep(30)
+    def _schedule(self, delay: float, job: Callable, *args):
+        """Run job(*args) on the scheduler thread after delay seconds"""
+        with self._timer_cv:
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._timer_seq), job, args))
+            self._timer_cv.notify()
+    
+    def _schedule_every(self, interval: float, job: Callable):
+        """Run job on the scheduler thread every interval seconds"""
+        @functools.wraps(job)
+        def run():
+            try:
+                job()
+            finally:
+                self._schedule(interval, run)
         
-        thread = threading.Thread(target=process_alerts, daemon=True)
-        thread.start()
-        logger.info("Alert processor started")
+        self._schedule(interval, run)
     
-    def _start_escalation_scheduler(self):
-        """Start escalation scheduler"""
-        def check_escalations():
-            while True:
-                try:
-                    current_time = datetime.now()
-                    
-                    for alert in self.active_alerts.values():
-                        if alert.status == AlertStatus.SENT and alert.escalation_level < self.escalation_rules[alert.severity.value]["max_level"]:
-                            # Check if escalation timeout has been reached
-                            if (current_time - alert.last_attempt).total_seconds() > self.escalation_rules[alert.severity.value]["escalation_timeout"]:
-                                self._escalate_alert(alert)
-                    
-                    time.sleep(60)  # Check every minute
-                    
-                except Exception as e:
-                    logger.error(f"Error in escalation scheduler: {e}")
-                    time.sleep(60)
+    def _run_scheduler(self):
+        """Scheduler thread: sleep until the earliest job is due, then run it.
         
-        thread = threading.Thread(target=check_escalations, daemon=True)
-        thread.start()
-        logger.info("Escalation scheduler started")
+        Jobs only decide what is due and hand the work to the dispatcher
+        threads or the channel pool; a job blocking on network I/O would
+        delay every other timer.
+        """
+        while True:
+            with self._timer_cv:
+                while self._running:
+                    if self._timers:
+                        timeout = self._timers[0][0] - time.monotonic()
+                        if timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+                    self._timer_cv.wait(timeout)
+                if not self._running:
+                    return
+                _, _, job, args = heapq.heappop(self._timers)
+            
+            try:
+                job(*args)
+            except Exception as e:
+                logger.error(f"Error in scheduled job {getattr(job, '__name__', job)}: {e}")
+    
+    def _start_alert_processor(self):
+        """Schedule background alert processing"""
+        # Failed alerts are retried by their own _retry_alert timers
+        self._schedule_every(10, self._close_idle_smtp_sessions)
+        logger.info("Alert processor started")
     
     def create_alert(self, 
                     title: str, 
@@ -220,133 +387,387 @@ class AlertManager:
                     metadata: Optional[Dict[str, Any]] = None,
                     channels: Optional[List[NotificationChannel]] = None,
                     incident_id: Optional[str] = None) -> Alert:
-        """Create a new alert"""
-        alert_id = f"ALERT-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{hashlib.md5(f'{title}{source}'.encode()).hexdigest()[:8]}"
-        
-        # Determine channels based on severity if not specified
-        if channels is None:
-            channels = self.escalation_rules[severity.value]["initial_channels"]
-        
-        alert = Alert(
-            id=alert_id,
-            title=title,
-            description=description,
-            severity=severity,
-            source=source,
-            timestamp=datetime.now(),
-            metadata=metadata or {},
-            status=AlertStatus.NEW,
-            escalation_level=0,
-            assigned_to=None,
-            channels=channels,
-            incident_id=incident_id
+        """Create a new alert, or merge it into an identical recent one"""
+        alert, created = self._register_alert(
+            title, description, severity, source, metadata, channels, incident_id
         )
+        if created:
+            # Hand off to the dispatcher threads; blocks only if the queue is full
+            self._ingest_queue.put(alert)
+        return alert
+    
+    def create_alerts(self, alerts: List[Dict[str, Any]]) -> List[Alert]:
+        """Create several alerts from create_alert keyword arguments.
         
-        self.active_alerts[alert_id] = alert
-        logger.info(f"Alert created: {alert_id} - {title}")
+        All new alerts are registered before any is queued, so the
+        dispatchers pick them up together and send them as one batch per
+        channel. Returns the alerts in the order given.
+        """
+        registered = [self._register_alert(**kwargs) for kwargs in alerts]
+        for alert, created in registered:
+            if created:
+                self._ingest_queue.put(alert)
+        return [alert for alert, _ in registered]
+    
+    def _register_alert(self,
+                        title: str,
+                        description: str,
+                        severity: AlertSeverity,
+                        source: str,
+                        metadata: Optional[Dict[str, Any]] = None,
+                        channels: Optional[List[NotificationChannel]] = None,
+                        incident_id: Optional[str] = None) -> Tuple[Alert, bool]:
+        """Add an alert to the active set without queueing it for dispatch.
         
-        # Start notification process
-        self._process_alert(alert)
+        Returns the alert and whether it is new; a duplicate of a recent
+        open alert is merged into that alert instead.
+        """
+        # Own copy, so later changes by the caller or by resolve_alert do
+        # not alter the alert or its fingerprint
+        metadata = dict(metadata or {})
+        fingerprint = self._fingerprint(title, source, metadata)
         
+        with self._dedup_lock(fingerprint):
+            existing = self._find_duplicate(fingerprint)
+            if existing is not None:
+                existing.occurrences += 1
+                existing.last_occurrence = datetime.now()
+                logger.info(f"Duplicate of alert {existing.id} suppressed - {title}")
+                return existing, False
+            
+            alert_id = f"ALERT-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{hashlib.blake2b(f'{title}|{source}'.encode(), digest_size=4).hexdigest()}"
+        
+            # Determine channels based on severity if not specified
+            if channels is None:
+                channels = list(ESCALATION_RULES[severity].initial_channels)
+        
+            alert = Alert(
+                id=alert_id,
+                title=title,
+                description=description,
+                severity=severity,
+                source=source,
+                timestamp=datetime.now(),
+                metadata=metadata,
+                status=AlertStatus.NEW,
+                escalation_level=0,
+                assigned_to=None,
+                channels=channels,
+                incident_id=incident_id,
+                fingerprint=fingerprint
+            )
+        
+            # Ids only have one-second resolution, so a different alert with
+            # the same title and source may already hold this one; suffix it
+            # rather than replace that alert
+            suffix = 1
+            while True:
+                alerts, lock = self._shard(alert.id)
+                with lock:
+                    if alert.id not in alerts:
+                        alerts[alert.id] = alert
+                        with self._counts_lock:
+                            self._counts["by_status"][AlertStatus.NEW] += 1
+                        break
+                suffix += 1
+                alert.id = f"{alert_id}-{suffix}"
+            self._fingerprints[fingerprint] = (alert.id, time.monotonic())
+            logger.info(f"Alert created: {alert.id} - {title}")
+        
+            return alert, True
+    
+    def _shard(self, alert_id: str):
+        """Return the (alerts, lock) shard holding alert_id"""
+        return self._shards[hash(alert_id) % ACTIVE_ALERT_SHARDS]
+    
+    def _get_active_alert(self, alert_id: str) -> Optional[Alert]:
+        """Look up an active alert by id"""
+        alerts, lock = self._shard(alert_id)
+        with lock:
+            return alerts.get(alert_id)
+    
+    def _dedup_lock(self, fingerprint: str) -> threading.Lock:
+        """Return the lock guarding the _fingerprints entry for fingerprint"""
+        return self._dedup_locks[hash(fingerprint) % ACTIVE_ALERT_SHARDS]
+    
+    @staticmethod
+    def _fingerprint(title: str, source: str, metadata: Optional[Dict[str, Any]]) -> str:
+        """Identify alerts that describe the same event"""
+        canonical = dumps_json(metadata or {}, sort_keys=True)
+        return hashlib.blake2b(
+            f"{title}|{source}|".encode() + canonical, digest_size=16
+        ).hexdigest()
+    
+    def _find_duplicate(self, fingerprint: str) -> Optional[Alert]:
+        """Return the still-open alert fingerprint was first seen on, if any.
+        
+        Caller must hold the _dedup_lock for fingerprint.
+        """
+        entry = self._fingerprints.get(fingerprint)
+        if entry is None:
+            return None
+        
+        alert_id, first_seen = entry
+        alert = self._get_active_alert(alert_id)
+        if (alert is None
+                or alert.status not in (AlertStatus.NEW, AlertStatus.SENT)
+                or time.monotonic() - first_seen > DEDUP_WINDOW):
+            del self._fingerprints[fingerprint]
+            return None
         return alert
     
+    def _dispatch_alerts(self):
+        """Dispatcher thread: drain the ingest queue in batches"""
+        while True:
+            alert = self._ingest_queue.get()
+            if alert is None:
+                return
+            batch = [alert]
+            while len(batch) < ALERT_BATCH_SIZE:
+                try:
+                    alert = self._ingest_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if alert is None:
+                    # Shutdown sentinel; send what we have first
+                    self._process_alerts(batch)
+                    return
+                batch.append(alert)
+            self._process_alerts(batch)
+    
     def _process_alert(self, alert: Alert):
         """Process an alert through the notification pipeline"""
-        try:
-            alert.status = AlertStatus.SENT
-            alert.last_attempt = datetime.now()
-            
-            # Send to all configured channels
-            success_count = 0
+        self._process_alerts([alert])
+    
+    def _process_alerts(self, alerts: List[Alert]):
+        """Process a batch of alerts through the notification pipeline.
+        
+        Alerts are grouped by channel (and by recipient list for email) so
+        each group is delivered with a single message where the channel
+        supports it.
+        """
+        # Alerts acknowledged or resolved while queued need no notification
+        alerts = [
+            alert for alert in alerts
+            if self._set_status(alert, AlertStatus.SENT, (AlertStatus.NEW, AlertStatus.ESCALATED))
+        ]
+        
+        now = datetime.now()
+        now_mono = time.monotonic()
+        success_counts = {}
+        groups = {}
+        for alert in alerts:
+            alert.last_attempt = now
+            alert.last_attempt_mono = now_mono
+            success_counts[alert.id] = 0
             for channel in alert.channels:
                 if channel in self.notification_handlers:
-                    try:
-                        self.notification_handlers[channel](alert)
-                        success_count += 1
-                        logger.info(f"Alert {alert.id} sent via {channel.value}")
-                    except Exception as e:
-                        logger.error(f"Failed to send alert {alert.id} via {channel.value}: {e}")
-                        alert.retry_count += 1
-            
-            if success_count == 0:
+                    recipients = self._get_recipient_list(alert) if channel == NotificationChannel.EMAIL else None
+                    groups.setdefault((channel, recipients), []).append(alert)
+        
+        # Send to all configured channels at once
+        futures = [
+            (group, self._channel_pool.submit(self._deliver, channel, group))
+            for (channel, _), group in groups.items()
+        ]
+        for group, future in futures:
+            delivered = future.result()
+            for alert in group:
+                if alert.id in delivered:
+                    success_counts[alert.id] += 1
+                else:
+                    alert.retry_count += 1
+        
+        for alert in alerts:
+            if success_counts[alert.id] == 0:
                 logger.error(f"Failed to send alert {alert.id} to any channel")
-                alert.status = AlertStatus.NEW  # Reset status for retry
-            
-        except Exception as e:
-            logger.error(f"Error processing alert {alert.id}: {e}")
-            alert.status = AlertStatus.NEW
-    
-    def _process_pending_alerts(self):
-        """Process pending alerts (for retry logic)"""
-        current_time = datetime.now()
-        
-        for alert in self.active_alerts.values():
-            if alert.status == AlertStatus.NEW:
-                # Retry failed alerts after a delay
-                if alert.retry_count > 0 and alert.last_attempt:
-                    time_since_last = (current_time - alert.last_attempt).total_seconds()
-                    if time_since_last > 300:  # 5 minutes
-                        self._process_alert(alert)
-    
-    def _retry_failed_alerts(self):
-        """Retry failed alerts"""
-        for alert in list(self.active_alerts.values()):
-            if alert.status == AlertStatus.NEW and alert.retry_count < 3:
-                # This is handled in _process_pending_alerts
-                pass
+                # Reset status for retry, unless acknowledged or resolved meanwhile
+                if self._set_status(alert, AlertStatus.NEW, (AlertStatus.SENT,)):
+                    self._schedule(ALERT_RETRY_DELAY, self._retry_alert, alert.id, alert.last_attempt_mono)
+            else:
+                self._schedule_escalation(alert)
+    
+    def _add_to_history(self, alert: Alert):
+        """Insert a resolved alert into the history in creation order.
+        
+        Caller must hold _counts_lock. Alerts are mostly resolved in the
+        order they were raised, so the insertion point is almost always at
+        the end. When the history is full the oldest entries are dropped in
+        one chunk, so the lists are shifted once per chunk, not per alert.
+        """
+        ts = alert.timestamp.timestamp()
+        i = bisect.bisect_right(self._history_ts, ts)
+        self.alert_history.insert(i, alert)
+        self._history_ts.insert(i, ts)
+        
+        excess = len(self._history_ts) - self._history_max
+        if excess > 0:
+            drop = max(excess, self._history_max // ALERT_HISTORY_TRIM)
+            for old in self.alert_history[:drop]:
+                self._counts["by_severity"][old.severity] -= 1
+            self._counts["resolved"] -= drop
+            del self.alert_history[:drop]
+            del self._history_ts[:drop]
+    
+    def _set_status(self, alert: Alert, status: AlertStatus,
+                    from_statuses: Optional[Tuple[AlertStatus, ...]] = None) -> bool:
+        """Move an active alert to status, keeping the status counts in step.
+        
+        Returns False and leaves the alert alone if it is no longer active,
+        is already in status, or is not in one of from_statuses. The check
+        and the move happen under the alert's shard lock, so they cannot
+        interleave with another transition or with resolve_alert.
+        """
+        alerts, lock = self._shard(alert.id)
+        with lock:
+            if (alerts.get(alert.id) is not alert
+                    or alert.status == status
+                    or (from_statuses is not None and alert.status not in from_statuses)):
+                return False
+            with self._counts_lock:
+                by_status = self._counts["by_status"]
+                by_status[alert.status] -= 1
+                by_status[status] += 1
+                alert.status = status
+            return True
+    
+    def _deliver(self, channel: NotificationChannel, group: List[Alert]) -> set:
+        """Send a group of alerts via one channel; returns the ids delivered"""
+        batch_handler = self.batch_notification_handlers.get(channel)
+        if batch_handler is not None:
+            try:
+                batch_handler(group)
+            except Exception as e:
+                logger.error(f"Failed to send {len(group)} alert(s) via {channel.value}: {e}")
+                return set()
+            logger.info(f"{len(group)} alert(s) sent via {channel.value}")
+            return {alert.id for alert in group}
+        
+        delivered = set()
+        for alert in group:
+            try:
+                self.notification_handlers[channel](alert)
+                delivered.add(alert.id)
+                logger.info(f"Alert {alert.id} sent via {channel.value}")
+            except Exception as e:
+                logger.error(f"Failed to send alert {alert.id} via {channel.value}: {e}")
+        return delivered
+    
+    def _retry_alert(self, alert_id: str, last_attempt_mono: float):
+        """Send an alert again after a failed attempt.
+        
+        Stale timers, for alerts acknowledged, resolved or re-sent since the
+        failure, are ignored.
+        """
+        alert = self._get_active_alert(alert_id)
+        if alert is None or alert.status != AlertStatus.NEW or alert.last_attempt_mono != last_attempt_mono:
+            return
+        self._requeue(alert)
+    
+    def _requeue(self, alert: Alert):
+        """Hand an alert back to the dispatcher threads from the scheduler.
+        
+        Never blocks: if the ingest queue is full the alert is handed over
+        again after ALERT_RETRY_DELAY. The dispatcher skips it if it has
+        been acknowledged or resolved by then.
+        """
+        try:
+            self._ingest_queue.put_nowait(alert)
+        except queue.Full:
+            logger.warning(f"Alert queue full, deferring alert {alert.id}")
+            self._schedule(ALERT_RETRY_DELAY, self._requeue, alert)
+    
+    def _close_idle_smtp_sessions(self):
+        """Close SMTP sessions that have been idle too long"""
+        # Closing a session talks to the server, so keep it off the scheduler thread
+        self._channel_pool.submit(self._drain_smtp_pool, idle_only=True)
+    
+    def _schedule_escalation(self, alert: Alert):
+        """Queue an escalation check for when the alert's escalation timeout expires"""
+        rules = ESCALATION_RULES[alert.severity]
+        if alert.escalation_level < rules.max_level:
+            self._schedule(rules.escalation_timeout, self._check_escalation, alert.id, alert.last_attempt_mono)
+    
+    def _check_escalation(self, alert_id: str, last_attempt_mono: float):
+        """Escalate an alert whose timeout expired while it was still unacknowledged.
+        
+        Entries for alerts that were acknowledged, resolved or re-sent since
+        the check was queued are stale and ignored.
+        """
+        alert = self._get_active_alert(alert_id)
+        if alert is None or alert.status != AlertStatus.SENT or alert.last_attempt_mono != last_attempt_mono:
+            return
+        self._escalate_alert(alert)
     
     def _escalate_alert(self, alert: Alert):
         """Escalate an alert to the next level"""
-        if alert.escalation_level < self.escalation_rules[alert.severity.value]["max_level"]:
+        rules = ESCALATION_RULES[alert.severity]
+        if (alert.escalation_level < rules.max_level
+                and self._set_status(alert, AlertStatus.ESCALATED, (AlertStatus.SENT,))):
             alert.escalation_level += 1
-            alert.status = AlertStatus.ESCALATED
             
             # Add escalation channels
-            escalation_channels = self.escalation_rules[alert.severity.value]["escalation_channels"]
-            for channel in escalation_channels:
+            for channel in rules.escalation_channels:
                 if channel not in alert.channels:
                     alert.channels.append(channel)
             
             # Send escalated alert
-            self._process_alert(alert)
+            self._requeue(alert)
             
             logger.warning(f"Alert {alert.id} escalated to level {alert.escalation_level}")
     
     def acknowledge_alert(self, alert_id: str, acknowledged_by: str) -> bool:
         """Acknowledge an alert"""
-        if alert_id in self.active_alerts:
-            alert = self.active_alerts[alert_id]
-            alert.status = AlertStatus.ACKNOWLEDGED
-            alert.acknowledged_at = datetime.now()
-            alert.assigned_to = acknowledged_by
-            
-            # Call acknowledgment callbacks
-            for callback in self.acknowledgment_callbacks:
-                try:
-                    callback(alert)
-                except Exception as e:
-                    logger.error(f"Error in acknowledgment callback: {e}")
-            
-            logger.info(f"Alert {alert.id} acknowledged by {acknowledged_by}")
-            return True
+        alert = self._get_active_alert(alert_id)
+        if alert is None:
+            return False
+        if not self._set_status(alert, AlertStatus.ACKNOWLEDGED):
+            # Already acknowledged (nothing to count or notify), or resolved meanwhile
+            return alert.status == AlertStatus.ACKNOWLEDGED
         
-        return False
+        alert.acknowledged_at = datetime.now()
+        with self._counts_lock:
+            self._counts["acknowledged"] += 1
+        alert.assigned_to = acknowledged_by
+        
+        # Call acknowledgment callbacks
+        for callback in self.acknowledgment_callbacks:
+            try:
+                callback(alert)
+            except Exception as e:
+                logger.error(f"Error in acknowledgment callback: {e}")
+        
+        logger.info(f"Alert {alert.id} acknowledged by {acknowledged_by}")
+        return True
     
     def resolve_alert(self, alert_id: str, resolved_by: str, resolution_notes: Optional[str] = None) -> bool:
         """Resolve an alert"""
-        if alert_id in self.active_alerts:
-            alert = self.active_alerts[alert_id]
-            alert.status = AlertStatus.RESOLVED
+        alerts, lock = self._shard(alert_id)
+        with lock:
+            alert = alerts.pop(alert_id, None)
+            if alert is not None:
+                # Still under the shard lock, so no _set_status can move the
+                # alert between buckets in the meantime
+                with self._counts_lock:
+                    self._counts["by_status"][alert.status] -= 1
+                    self._counts["by_severity"][alert.severity] += 1
+                    self._counts["resolved"] += 1
+                    alert.status = AlertStatus.RESOLVED
+                    self._add_to_history(alert)
+        
+        if alert is not None:
             alert.resolved_at = datetime.now()
             
             # Add resolution notes to metadata
             if resolution_notes:
                 alert.metadata["resolution_notes"] = resolution_notes
             alert.metadata["resolved_by"] = resolved_by
+            alert.metadata_html = None
             
-            # Move to history
-            self.alert_history.append(alert)
-            del self.active_alerts[alert_id]
+            # A repeat of this alert is a new alert again
+            with self._dedup_lock(alert.fingerprint):
+                if self._fingerprints.get(alert.fingerprint, (None,))[0] == alert_id:
+                    del self._fingerprints[alert.fingerprint]
             
             # Call resolution callbacks
             for callback in self.resolution_callbacks:
@@ -362,35 +783,166 @@ class AlertManager:
     
     def _send_email_alert(self, alert: Alert):
         """Send alert via email"""
+        self._send_email_batch([alert])
+    
+    def _send_email_batch(self, alerts: List[Alert]):
+        """Send alerts sharing a recipient list as a single email"""
         config = self.config.get("alerting", {}).get("email", {})
         
         if not config.get("smtp_server"):
             logger.warning("Email configuration not available")
             return
         
+        import smtplib
+        from email.message import EmailMessage
+        
         # Create message
-        msg = MimeMultipart()
+        msg = EmailMessage()
         msg['From'] = config.get("from_address", "alerts@company.com")
-        msg['To'] = self._get_recipient_list(alert)
-        msg['Subject'] = f"[{alert.severity.value.upper()}] {alert.title}"
+        msg['To'] = self._get_recipient_list(alerts[0])
+        if len(alerts) == 1:
+            msg['Subject'] = f"[{alerts[0].severity.value.upper()}] {alerts[0].title}"
+            body = self._format_email_body(alerts[0])
+        else:
+            severity = max((alert.severity for alert in alerts), key=SEVERITY_ORDER.index)
+            msg['Subject'] = f"[{severity.value.upper()}] {len(alerts)} security alerts"
+            body = self._format_email_digest(alerts)
         
-        # Email body
-        body = self._format_email_body(alert)
-        msg.attach(MimeText(body, 'html'))
+        # Single-part HTML body; no multipart container is needed
+        msg.set_content(body, subtype='html')
         
-        # Send email
+        # Send email over a pooled session
+        if not self._smtp_slots.acquire(timeout=SMTP_CHECKOUT_TIMEOUT):
+            raise TimeoutError("No SMTP session available for email alert")
+        pooled = None
         try:
-            server = smtplib.SMTP(config.get("smtp_server"), config.get("smtp_port", 587))
-            server.starttls()
-            server.login(config.get("username"), config.get("password"))
-            server.send_message(msg)
-            server.quit()
+            pooled = self._checkout_smtp(config)
+            try:
+                pooled.conn.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped the session between the liveness check and the send
+                self._discard_smtp(pooled)
+                pooled = self._connect_smtp(config)
+                pooled.conn.send_message(msg)
+            pooled.messages_sent += 1
+            pooled.last_used = time.monotonic()
+            self._checkin_smtp(pooled)
         except Exception as e:
             logger.error(f"Failed to send email alert: {e}")
+            if pooled is not None:
+                self._discard_smtp(pooled)
             raise
+        finally:
+            self._smtp_slots.release()
+    
+    def _connect_smtp(self, config: Dict[str, Any]) -> PooledSMTP:
+        """Open and authenticate a new SMTP session"""
+        import smtplib
+        
+        server = smtplib.SMTP(config.get("smtp_server"), config.get("smtp_port", 587), timeout=30)
+        server.starttls()
+        server.login(config.get("username"), config.get("password"))
+        return PooledSMTP(server)
+    
+    def _checkout_smtp(self, config: Dict[str, Any]) -> PooledSMTP:
+        """Take a live session from the pool, or open a new one if none is idle"""
+        import smtplib
+        
+        while True:
+            try:
+                pooled = self._smtp_pool.get_nowait()
+            except queue.Empty:
+                return self._connect_smtp(config)
+            try:
+                if pooled.conn.noop()[0] == 250:
+                    return pooled
+            except smtplib.SMTPException:
+                pass
+            self._discard_smtp(pooled)
+    
+    def _checkin_smtp(self, pooled: PooledSMTP):
+        """Return a session to the pool unless it has reached its message limit"""
+        if pooled.messages_sent >= SMTP_MAX_MESSAGES_PER_CONNECTION:
+            self._discard_smtp(pooled)
+            return
+        try:
+            self._smtp_pool.put_nowait(pooled)
+        except queue.Full:
+            self._discard_smtp(pooled)
+    
+    def _discard_smtp(self, pooled: PooledSMTP):
+        """Close a session that is not going back into the pool"""
+        try:
+            pooled.conn.quit()
+        except Exception:
+            pooled.conn.close()
+    
+    def _drain_smtp_pool(self, idle_only: bool = False):
+        """Close pooled sessions; with idle_only, only those idle past SMTP_IDLE_TIMEOUT"""
+        keep = []
+        cutoff = time.monotonic() - SMTP_IDLE_TIMEOUT
+        while True:
+            try:
+                pooled = self._smtp_pool.get_nowait()
+            except queue.Empty:
+                break
+            if idle_only and pooled.last_used > cutoff:
+                keep.append(pooled)
+            else:
+                self._discard_smtp(pooled)
+        # Put back in reverse so the most recently used session stays on top
+        for pooled in reversed(keep):
+            self._checkin_smtp(pooled)
+    
+    def _get_http_session(self) -> "requests.Session":
+        """Return the shared HTTP session, creating it on first use"""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = self._create_http_session()
+        return self._http
+    
+    def _create_http_session(self) -> "requests.Session":
+        """Create the pooled HTTP session used by the webhook channels"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        retries = Retry(
+            total=HTTP_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset(["POST"])
+        )
+        session.mount("https://", HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=retries
+        ))
+        return session
+    
+    def shutdown(self):
+        """Stop background jobs and release network resources"""
+        with self._timer_cv:
+            self._running = False
+            self._timer_cv.notify()
+        for _ in self._dispatch_threads:
+            self._ingest_queue.put(None)
+        for thread in self._dispatch_threads:
+            thread.join()
+        self._channel_pool.shutdown()
+        self._drain_smtp_pool()
+        if self._http is not None:
+            self._http.close()
+        logger.info("Alert Manager shut down")
     
     def _send_slack_alert(self, alert: Alert):
         """Send alert to Slack"""
+        self._send_slack_batch([alert])
+    
+    def _send_slack_batch(self, alerts: List[Alert]):
+        """Send alerts to Slack as one message with an attachment per alert"""
         config = self.config.get("alerting", {}).get("slack", {})
         webhook_url = config.get("webhook_url")
         
@@ -398,40 +950,61 @@ class AlertManager:
             logger.warning("Slack webhook URL not configured")
             return
         
+        if len(alerts) == 1:
+            text = f"🚨 Security Alert: {alerts[0].title}"
+        else:
+            text = f"🚨 {len(alerts)} Security Alerts"
+        
         payload = {
-            "text": f"🚨 Security Alert: {alert.title}",
-            "attachments": [
-                {
-                    "color": self._get_slack_color(alert.severity),
-                    "fields": [
-                        {
-                            "title": "Severity",
-                            "value": alert.severity.value.upper(),
-                            "short": True
-                        },
-                        {
-                            "title": "Source",
-                            "value": alert.source,
-                            "short": True
-                        },
-                        {
-                            "title": "Time",
-                            "value": alert.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                            "short": True
-                        }
-                    ],
-                    "text": alert.description
-                }
-            ]
+            "text": text,
+            "attachments": [self._slack_attachment(alert) for alert in alerts]
         }
         
         try:
-            response = requests.post(webhook_url, json=payload, timeout=10)
+            response = self._get_http_session().post(
+                webhook_url,
+                data=dumps_json(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=10
+            )
             response.raise_for_status()
         except Exception as e:
             logger.error(f"Failed to send Slack alert: {e}")
             raise
     
+    def _slack_attachment(self, alert: Alert) -> Dict[str, Any]:
+        """Build the Slack attachment describing one alert"""
+        attachment = {
+            "color": self._get_slack_color(alert.severity),
+            "fields": [
+                {
+                    "title": "Severity",
+                    "value": alert.severity.value.upper(),
+                    "short": True
+                },
+                {
+                    "title": "Source",
+                    "value": alert.source,
+                    "short": True
+                },
+                {
+                    "title": "Time",
+                    "value": alert.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+                    "short": True
+                }
+            ],
+            "text": alert.description
+        }
+        
+        if alert.occurrences > 1:
+            attachment["fields"].append({
+                "title": "Occurrences",
+                "value": str(alert.occurrences),
+                "short": True
+            })
+        
+        return attachment
+    
     def _send_teams_alert(self, alert: Alert):
         """Send alert to Microsoft Teams"""
         # Teams integration would be similar to Slack
@@ -469,52 +1042,53 @@ class AlertManager:
     
     def _format_email_body(self, alert: Alert) -> str:
         """Format alert for email"""
-        status_emoji = {
-            AlertSeverity.CRITICAL: "🔴",
-            AlertSeverity.HIGH: "🟠", 
-            AlertSeverity.MEDIUM: "🟡",
-            AlertSeverity.LOW: "🔵"
-        }
-        
-        emoji = status_emoji.get(alert.severity, "⚪")
-        
-        return f"""
-        <html>
-        <body>
-            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                <h2 style="color: #d32f2f;">{emoji} Security Alert</h2>
+        return self._wrap_email_html(self._format_email_section(alert))
+    
+    def _format_email_digest(self, alerts: List[Alert]) -> str:
+        """Format several alerts as one email"""
+        separator = '\n                <hr style="margin: 30px 0;">\n'
+        return self._wrap_email_html(separator.join(self._format_email_section(alert) for alert in alerts))
+    
+    # Details block for one alert; digests repeat it once per alert
+    _EMAIL_SECTION_TEMPLATE = string.Template("""                <h2 style="color: #d32f2f;">$emoji Security Alert</h2>
                 
                 <table style="width: 100%; border-collapse: collapse; margin: 20px 0;">
                     <tr>
                         <td style="padding: 8px; border: 1px solid #ddd; font-weight: bold;">Alert ID:</td>
-                        <td style="padding: 8px; border: 1px solid #ddd;">{alert.id}</td>
+                        <td style="padding: 8px; border: 1px solid #ddd;">$alert_id</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px; border: 1px solid #ddd; font-weight: bold;">Title:</td>
-                        <td style="padding: 8px; border: 1px solid #ddd;">{alert.title}</td>
+                        <td style="padding: 8px; border: 1px solid #ddd;">$title</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px; border: 1px solid #ddd; font-weight: bold;">Severity:</td>
-                        <td style="padding: 8px; border: 1px solid #ddd; color: {self._get_severity_color(alert.severity)}; font-weight: bold;">{alert.severity.value.upper()}</td>
+                        <td style="padding: 8px; border: 1px solid #ddd; color: $severity_color; font-weight: bold;">$severity</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px; border: 1px solid #ddd; font-weight: bold;">Source:</td>
-                        <td style="padding: 8px; border: 1px solid #ddd;">{alert.source}</td>
+                        <td style="padding: 8px; border: 1px solid #ddd;">$source</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px; border: 1px solid #ddd; font-weight: bold;">Time:</td>
-                        <td style="padding: 8px; border: 1px solid #ddd;">{alert.timestamp.strftime("%Y-%m-%d %H:%M:%S")}</td>
+                        <td style="padding: 8px; border: 1px solid #ddd;">$time</td>
                     </tr>
                     <tr>
                         <td style="padding: 8px; border: 1px solid #ddd; font-weight: bold;">Status:</td>
-                        <td style="padding: 8px; border: 1px solid #ddd;">{alert.status.value.upper()}</td>
+                        <td style="padding: 8px; border: 1px solid #ddd;">$status</td>
                     </tr>
                 </table>
                 
                 <h3>Description:</h3>
-                <p style="background-color: #f5f5f5; padding: 15px; border-radius: 5px;">{alert.description}</p>
+                <p style="background-color: #f5f5f5; padding: 15px; border-radius: 5px;">$description</p>
                 
-                {f'<h3>Additional Information:</h3><pre style="background-color: #f5f5f5; padding: 15px; border-radius: 5px; overflow-x: auto;">{json.dumps(alert.metadata, indent=2, default=str)}</pre>' if alert.metadata else ''}
+                $metadata_html""")
+    
+    _EMAIL_PAGE_TEMPLATE = string.Template("""
+        <html>
+        <body>
+            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+$sections
                 
                 <div style="margin-top: 30px; padding: 15px; background-color: #e3f2fd; border-radius: 5px;">
                     <p><strong>Action Required:</strong> Please investigate this security alert immediately.</p>
@@ -523,27 +1097,44 @@ class AlertManager:
             </div>
         </body>
         </html>
-        """
+        """)
+    
+    def _format_email_section(self, alert: Alert) -> str:
+        """Format the details block for one alert"""
+        return self._EMAIL_SECTION_TEMPLATE.substitute(
+            emoji=SEVERITY_EMOJI.get(alert.severity, "⚪"),
+            alert_id=alert.id,
+            title=alert.title,
+            severity_color=self._get_severity_color(alert.severity),
+            severity=alert.severity.value.upper(),
+            source=alert.source,
+            time=alert.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            status=alert.status.value.upper(),
+            description=alert.description,
+            metadata_html=self._format_metadata_html(alert)
+        )
+    
+    def _format_metadata_html(self, alert: Alert) -> str:
+        """Render alert metadata once and reuse it for retries and escalations"""
+        if alert.metadata_html is None:
+            alert.metadata_html = (
+                '<h3>Additional Information:</h3><pre style="background-color: #f5f5f5; padding: 15px; border-radius: 5px; overflow-x: auto;">'
+                f'{dumps_json(alert.metadata, indent=True).decode()}</pre>'
+                if alert.metadata else ''
+            )
+        return alert.metadata_html
+    
+    def _wrap_email_html(self, sections: str) -> str:
+        """Wrap alert detail blocks in the email page layout"""
+        return self._EMAIL_PAGE_TEMPLATE.substitute(sections=sections)
     
     def _get_severity_color(self, severity: AlertSeverity) -> str:
         """Get color for severity level"""
-        colors = {
-            AlertSeverity.CRITICAL: "#d32f2f",
-            AlertSeverity.HIGH: "#f57c00",
-            AlertSeverity.MEDIUM: "#fbc02d",
-            AlertSeverity.LOW: "#1976d2"
-        }
-        return colors.get(severity, "#757575")
+        return SEVERITY_COLORS.get(severity, "#757575")
     
     def _get_slack_color(self, severity: AlertSeverity) -> str:
         """Get Slack color for severity level"""
-        colors = {
-            AlertSeverity.CRITICAL: "danger",
-            AlertSeverity.HIGH: "warning",
-            AlertSeverity.MEDIUM: "good",
-            AlertSeverity.LOW: "#439FE0"
-        }
-        return colors.get(severity, "#E3E4E6")
+        return SLACK_COLORS.get(severity, "#E3E4E6")
     
     def register_acknowledgment_callback(self, callback: Callable[[Alert], None]):
         """Register a callback for alert acknowledgment"""
@@ -555,36 +1146,44 @@ class AlertManager:
     
     def get_active_alerts(self) -> List[Alert]:
         """Get all active alerts"""
-        return list(self.active_alerts.values())
+        active = []
+        for alerts, lock in self._shards:
+            with lock:
+                active.extend(alerts.values())
+        return active
     
     def get_alert_history(self, hours: int = 24) -> List[Alert]:
         """Get alert history from the last N hours"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        return [alert for alert in self.alert_history if alert.timestamp >= cutoff_time]
+        cutoff = time.time() - hours * 3600
+        with self._counts_lock:
+            i = bisect.bisect_left(self._history_ts, cutoff)
+            return self.alert_history[i:]
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get alert statistics"""
-        active = list(self.active_alerts.values())
-        history = self.alert_history
-        
-        return {
-            "active_alerts": len(active),
-            "total_alerts": len(history),
-            "alerts_by_severity": {
-                severity.value: len([a for a in history if a.severity == severity]) 
-                for severity in AlertSeverity
-            },
-            "alerts_by_status": {
-                status.value: len([a for a in active if a.status == status]) 
-                for status in AlertStatus
-            },
-            "recent_activity": {
-                "last_hour": len([a for a in history if (datetime.now() - a.timestamp).total_seconds() < 3600]),
-                "last_day": len([a for a in history if (datetime.now() - a.timestamp).total_seconds() < 86400])
-            },
-            "acknowledged_alerts": len([a for a in history if a.status == AlertStatus.ACKNOWLEDGED]),
-            "resolved_alerts": len([a for a in history if a.status == AlertStatus.RESOLVED])
-        }
+        now = time.time()
+        with self._counts_lock:
+            history_ts = self._history_ts
+            counts = self._counts
+            
+            return {
+                "active_alerts": sum(len(alerts) for alerts, _ in self._shards),
+                "total_alerts": len(self.alert_history),
+                "alerts_by_severity": {
+                    severity.value: counts["by_severity"][severity]
+                    for severity in AlertSeverity
+                },
+                "alerts_by_status": {
+                    status.value: counts["by_status"][status]
+                    for status in AlertStatus
+                },
+                "recent_activity": {
+                    "last_hour": len(history_ts) - bisect.bisect_left(history_ts, now - 3600),
+                    "last_day": len(history_ts) - bisect.bisect_left(history_ts, now - 86400)
+                },
+                "acknowledged_alerts": counts["acknowledged"],
+                "resolved_alerts": counts["resolved"]
+            }
 
 def main():
     """Main function to test the alert system"""
@@ -25,6 +25,50 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Known vulnerable services, keyed by lower-case service name
+VULNERABLE_SERVICES = {
+    "ftp": {
+        "default_creds": {
+            "title": "Default FTP Credentials",
+            "description": "FTP service using default or weak credentials",
+            "severity": "High",
+            "cvss_score": 7.5,
+            "remediation": "Change default passwords and implement strong authentication",
+            "references": ["CWE-1391"]
+        }
+    },
+    "ssh": {
+        "weak_ciphers": {
+            "title": "Weak SSH Encryption Ciphers",
+            "description": "SSH service using weak or deprecated encryption ciphers",
+            "severity": "Medium",
+            "cvss_score": 5.3,
+            "remediation": "Configure SSH to use only strong encryption algorithms",
+            "references": ["RFC 4253", "RFC 4254"]
+        }
+    },
+    "http": {
+        "version_disclosure": {
+            "title": "HTTP Version Disclosure",
+            "description": "Web server version information disclosed in headers",
+            "severity": "Low",
+            "cvss_score": 3.1,
+            "remediation": "Configure web server to hide version information",
+            "references": ["OWASP-A6"]
+        }
+    },
+    "mysql": {
+        "weak_credentials": {
+            "title": "MySQL Weak Credentials",
+            "description": "MySQL database accessible with weak or default credentials",
+            "severity": "Critical",
+            "cvss_score": 9.8,
+            "remediation": "Implement strong passwords and restrict database access",
+            "references": ["CWE-1391"]
+        }
+    }
+}
+
 class TestPhase(Enum):
     PLANNING = "planning"
     RECONNAISSANCE = "reconnaissance"
@@ -661,8 +705,9 @@ class PentestPreparation:
     
     def generate_vulnerability_report(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate vulnerability assessment report from scan results"""
+        now = datetime.now()
         report = {
-            "report_id": f"VULN-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+            "report_id": f"VULN-{now.strftime('%Y%m%d-%H%M%S')}",
             "scan_results": scan_results,
             "vulnerabilities": [],
             "risk_summary": {
@@ -695,7 +740,7 @@ class PentestPreparation:
                         proof_of_concept=vuln.get("poc", ""),
                         remediation=vuln["remediation"],
                         references=vuln.get("references", []),
-                        timestamp=datetime.now()
+                        timestamp=now
                     )
                     
                     report["vulnerabilities"].append(asdict(finding))
@@ -708,58 +753,8 @@ class PentestPreparation:
     
     def _check_service_vulnerabilities(self, service_name: str, service_version: str) -> List[Dict[str, Any]]:
         """Check service for known vulnerabilities"""
-        vulnerabilities = []
-        
-        # Database of known vulnerable services
-        vulnerable_services = {
-            "ftp": {
-                "default_creds": {
-                    "title": "Default FTP Credentials",
-                    "description": "FTP service using default or weak credentials",
-                    "severity": "High",
-                    "cvss_score": 7.5,
-                    "remediation": "Change default passwords and implement strong authentication",
-                    "references": ["CWE-1391"]
-                }
-            },
-            "ssh": {
-                "weak_ciphers": {
-                    "title": "Weak SSH Encryption Ciphers",
-                    "description": "SSH service using weak or deprecated encryption ciphers",
-                    "severity": "Medium",
-                    "cvss_score": 5.3,
-                    "remediation": "Configure SSH to use only strong encryption algorithms",
-                    "references": ["RFC 4253", "RFC 4254"]
-                }
-            },
-            "http": {
-                "version_disclosure": {
-                    "title": "HTTP Version Disclosure",
-                    "description": "Web server version information disclosed in headers",
-                    "severity": "Low",
-                    "cvss_score": 3.1,
-                    "remediation": "Configure web server to hide version information",
-                    "references": ["OWASP-A6"]
-                }
-            },
-            "mysql": {
-                "weak_credentials": {
-                    "title": "MySQL Weak Credentials",
-                    "description": "MySQL database accessible with weak or default credentials",
-                    "severity": "Critical",
-                    "cvss_score": 9.8,
-                    "remediation": "Implement strong passwords and restrict database access",
-                    "references": ["CWE-1391"]
-                }
-            }
-        }
-        
         # Check if service has known vulnerabilities
-        if service_name in vulnerable_services:
-            for vuln_name, vuln_info in vulnerable_services[service_name].items():
-                vulnerabilities.append(vuln_info)
-        
-        return vulnerabilities
+        return list(VULNERABLE_SERVICES.get(service_name, {}).values())
     
     def _generate_vulnerability_recommendations(self, vulnerabilities: List[Dict[str, Any]]) -> List[str]:
         """Generate recommendations based on vulnerabilities found"""
@@ -4,254 +4,325 @@ Incident Response System Demonstration
 Shows how to use the comprehensive incident response system
 """
 
+import importlib
+import importlib.util
+import io
 import json
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
 import sys
 import os
+import tempfile
 
 # Add the current directory to the path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import registry
+
+# orjson parses the fixtures faster; json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Demo input data, parsed once at import
+_FIXTURES_PATH = Path(__file__).parent / "fixtures" / "demo.json"
+_FIXTURES = (orjson or json).loads(_FIXTURES_PATH.read_bytes())
+
+# Services reported on 127.0.0.1 by the simulated network scan:
+# port -> (service name, version)
+SERVICE_TABLE = {
+    service["port"]: (service["name"], service["version"])
+    for service in _FIXTURES["services"]
+}
+
+@dataclass(frozen=True, slots=True)
+class IncidentData:
+    """Incident fields given to IncidentAnalyzer.calculate_incident_metrics"""
+    incident_id: str
+    severity: str
+    customer_impact: bool
+    regulatory_impact: bool
+    systems_affected: int
+    evidence_items: int
+    tasks_completed: int
+    team_members: Tuple[str, ...]
+    detection_time: str = ""
+    response_time: str = ""
+    containment_time: str = ""
+    resolution_time: str = ""
+
+# Analysis demo incident; the timestamps are filled in per run
+INCIDENT_DATA_TEMPLATE = IncidentData(**{
+    **_FIXTURES["incident"],
+    "team_members": tuple(_FIXTURES["incident"]["team_members"])
+})
+
+@dataclass(frozen=True, slots=True)
+class TargetInfo:
+    """Target fields given to PentestPreparation.create_pentest_plan"""
+    name: str
+    description: str
+    ip_addresses: Tuple[str, ...]
+    domains: Tuple[str, ...]
+    ports: Tuple[int, ...]
+    contact_info: Dict[str, str]
+
+# Assessment demo target
+TARGET_INFO = TargetInfo(
+    name=_FIXTURES["target_info"]["name"],
+    description=_FIXTURES["target_info"]["description"],
+    ip_addresses=tuple(_FIXTURES["target_info"]["ip_addresses"]),
+    domains=tuple(_FIXTURES["target_info"]["domains"]),
+    ports=tuple(SERVICE_TABLE),
+    contact_info=_FIXTURES["target_info"]["contact_info"]
+)
+
+_BANNER = "=" * 60
+
+# Closing lines of the demonstration summary
+_SUMMARY_LINES = (
+    "✓ System components tested:",
+    "  - Threat Detection Engine",
+    "  - Alert Management System",
+    "  - Evidence Collection System",
+    "  - Recovery Orchestration",
+    "  - Post-Incident Analysis",
+    "  - Security Assessment Tools",
+    "  - Integration Workflow",
+    "",
+    "🔒 Security Incident Response System Ready for Production",
+    "📊 For dashboard access, run: cd dashboard/incident-dashboard && npm run dev",
+    "📖 For full documentation, see: README.md",
+)
+_SUMMARY = "\n".join(_SUMMARY_LINES)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _section(title):
+    """Log a section header: a blank line, then title between banners"""
+    logger.info(f"\n{_BANNER}\n{title}\n{_BANNER}")
+
 def demo_threat_detection():
     """Demonstrate threat detection capabilities"""
-    print("\n" + "="*60)
-    print("THREAT DETECTION DEMONSTRATION")
-    print("="*60)
+    _section("THREAT DETECTION DEMONSTRATION")
+    if _skipped("threat detection", "threat_detection.threat_detector"):
+        return
     
     try:
-        from threat_detection.threat_detector import ThreatDetector, ThreatLevel, ThreatCategory, SecurityEvent
+        from threat_detection.threat_detector import SecurityEvent
+        
+        now = datetime.now()
         
         # Initialize threat detector
-        detector = ThreatDetector()
-        print("✓ Threat detection system initialized")
-        
-        # Simulate security events
-        events = []
-        
-        # Simulate failed login attempt
-        event1 = SecurityEvent(
-            id="demo_event_1",
-            event_type="failed_login",
-            source_ip="192.168.1.100",
-            target_ip=None,
-            timestamp=datetime.now(),
-            event_data={"username": "admin", "attempts": 5},
-            threat_indicators=[],
-            risk_score=0.6,
-            requires_investigation=True
-        )
-        events.append(event1)
-        
-        # Simulate suspicious process
-        event2 = SecurityEvent(
-            id="demo_event_2",
-            event_type="suspicious_process",
-            source_ip=None,
-            target_ip=None,
-            timestamp=datetime.now(),
-            event_data={"process_name": "mimikatz.exe", "pid": 1234},
-            threat_indicators=[],
-            risk_score=0.9,
-            requires_investigation=True
-        )
-        events.append(event2)
+        detector = registry.get_detector()
+        logger.info("✓ Threat detection system initialized")
+        
+        # Simulate security events: a failed login attempt and a
+        # suspicious process
+        events = SecurityEvent.from_batch([
+            {**event, "timestamp": now, "threat_indicators": []}
+            for event in _FIXTURES["security_events"]
+        ])
         
         # Process events
-        for event in events:
-            detector._process_security_event(event)
-            print(f"✓ Processed event: {event.event_type} (Risk: {event.risk_score})")
+        for event in detector.process_batch(events):
+            logger.info(f"✓ Processed event: {event.event_type} (Risk: {event.risk_score})")
         
         # Get statistics
         stats = detector.get_statistics()
-        print(f"✓ Detection statistics: {stats['total_events']} events processed")
+        logger.info(f"✓ Detection statistics: {stats['total_events']} events processed")
         
     except Exception as e:
-        print(f"✗ Error in threat detection demo: {e}")
+        logger.info(f"✗ Error in threat detection demo: {e}")
 
 def demo_alert_system():
     """Demonstrate alert management system"""
-    print("\n" + "="*60)
-    print("ALERT MANAGEMENT DEMONSTRATION")
-    print("="*60)
+    _section("ALERT MANAGEMENT DEMONSTRATION")
+    if _skipped("alert management", "alerts.alert_manager"):
+        return
     
     try:
-        from alerts.alert_manager import AlertManager, AlertSeverity
+        from alerts.alert_manager import AlertSeverity
         
         # Initialize alert manager
-        alert_manager = AlertManager()
-        print("✓ Alert management system initialized")
-        
-        # Create test alerts
-        alerts = []
-        
-        # Critical alert
-        alert1 = alert_manager.create_alert(
-            title="Suspicious Network Activity",
-            description="Unusual network traffic detected from external IP",
-            severity=AlertSeverity.CRITICAL,
-            source="Network Monitor",
-            metadata={"ip": "203.0.113.1", "port_scan": True}
-        )
-        alerts.append(alert1)
-        print(f"✓ Created critical alert: {alert1.id}")
-        
-        # High severity alert
-        alert2 = alert_manager.create_alert(
-            title="Multiple Failed Logins",
-            description="Brute force attack detected on admin account",
-            severity=AlertSeverity.HIGH,
-            source="Authentication System",
-            metadata={"attempts": 15, "source_ip": "192.168.1.100"}
-        )
-        alerts.append(alert2)
-        print(f"✓ Created high severity alert: {alert2.id}")
+        alert_manager = registry.get_alert_manager()
+        logger.info("✓ Alert management system initialized")
+        
+        # Create test alerts in one batch: a critical and a high severity alert
+        alerts = alert_manager.create_alerts([
+            {
+                "title": "Suspicious Network Activity",
+                "description": "Unusual network traffic detected from external IP",
+                "severity": AlertSeverity.CRITICAL,
+                "source": "Network Monitor",
+                "metadata": {"ip": "203.0.113.1", "port_scan": True}
+            },
+            {
+                "title": "Multiple Failed Logins",
+                "description": "Brute force attack detected on admin account",
+                "severity": AlertSeverity.HIGH,
+                "source": "Authentication System",
+                "metadata": {"attempts": 15, "source_ip": "192.168.1.100"}
+            }
+        ])
+        alert1, alert2 = alerts
+        logger.info(f"✓ Created critical alert: {alert1.id}")
+        logger.info(f"✓ Created high severity alert: {alert2.id}")
         
         # Simulate alert acknowledgment
         time.sleep(2)
         alert_manager.acknowledge_alert(alert1.id, "Security Analyst")
-        print(f"✓ Alert {alert1.id} acknowledged")
+        logger.info(f"✓ Alert {alert1.id} acknowledged")
         
         # Get statistics
         stats = alert_manager.get_statistics()
-        print(f"✓ Alert statistics: {stats['active_alerts']} active, {stats['total_alerts']} total")
+        logger.info(f"✓ Alert statistics: {stats['active_alerts']} active, {stats['total_alerts']} total")
         
     except Exception as e:
-        print(f"✗ Error in alert system demo: {e}")
+        logger.info(f"✗ Error in alert system demo: {e}")
 
 def demo_evidence_collection():
     """Demonstrate evidence collection system"""
-    print("\n" + "="*60)
-    print("EVIDENCE COLLECTION DEMONSTRATION")
-    print("="*60)
+    _section("EVIDENCE COLLECTION DEMONSTRATION")
+    if _skipped("evidence collection", "evidence.evidence_collector"):
+        return
     
     try:
-        from evidence.evidence_collector import EvidenceCollector
+        now = datetime.now()
         
         # Initialize evidence collector
-        collector = EvidenceCollector()
-        print("✓ Evidence collection system initialized")
-        
-        # Create a test file for evidence collection
-        test_file = "demo_evidence.txt"
-        with open(test_file, 'w') as f:
-            f.write("Demo evidence file for testing\n")
-            f.write(f"Created: {datetime.now()}\n")
-            f.write("This file contains sample evidence data.\n")
-        
-        # Collect file evidence
-        evidence = collector.collect_file_evidence(
-            incident_id="DEMO-2025-001",
-            source_path=test_file,
-            name="Demo File Evidence",
-            description="Sample file evidence for demonstration",
-            collected_by="Demo System",
-            metadata={"demo": True, "purpose": "system_demonstration"}
+        collector = registry.get_collector()
+        logger.info("✓ Evidence collection system initialized")
+        
+        # Create a test file for evidence collection; a unique temporary
+        # file keeps concurrent runs apart and is removed even on error
+        content = (
+            "Demo evidence file for testing\n"
+            f"Created: {now}\n"
+            "This file contains sample evidence data.\n"
         )
-        print(f"✓ File evidence collected: {evidence.id}")
-        
-        # Collect system evidence
-        system_evidence = collector.collect_system_evidence(
-            incident_id="DEMO-2025-001",
-            system_info={"demo": True, "test_run": True},
-            name="System Information Demo",
-            description="System state during demo",
-            collected_by="Demo System"
-        )
-        print(f"✓ System evidence collected: {system_evidence.id}")
-        
-        # Verify evidence integrity
-        integrity_check = collector.verify_evidence_integrity(evidence.id)
-        print(f"✓ Evidence integrity verification: {'PASSED' if integrity_check else 'FAILED'}")
-        
-        # Get statistics
-        stats = collector.get_statistics()
-        print(f"✓ Evidence statistics: {stats['total_collected']} items collected")
-        
-        # Cleanup
-        os.remove(test_file)
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write(content)
+            test_file = f.name
+        
+        try:
+            # Collect file evidence
+            evidence = collector.collect_file_evidence(
+                incident_id="DEMO-2025-001",
+                source_path=test_file,
+                name="Demo File Evidence",
+                description="Sample file evidence for demonstration",
+                collected_by="Demo System",
+                metadata={"demo": True, "purpose": "system_demonstration"}
+            )
+            logger.info(f"✓ File evidence collected: {evidence.id}")
+            
+            # Collect system evidence
+            system_evidence = collector.collect_system_evidence(
+                incident_id="DEMO-2025-001",
+                system_info={"demo": True, "test_run": True},
+                name="System Information Demo",
+                description="System state during demo",
+                collected_by="Demo System"
+            )
+            logger.info(f"✓ System evidence collected: {system_evidence.id}")
+            
+            # Verify evidence integrity
+            integrity_check = collector.verify_evidence_integrity(evidence.id)
+            logger.info(f"✓ Evidence integrity verification: {'PASSED' if integrity_check else 'FAILED'}")
+            
+            # Get statistics
+            stats = collector.get_statistics()
+            logger.info(f"✓ Evidence statistics: {stats['total_collected']} items collected")
+        
+        finally:
+            # Cleanup
+            os.remove(test_file)
         
     except Exception as e:
-        print(f"✗ Error in evidence collection demo: {e}")
+        logger.info(f"✗ Error in evidence collection demo: {e}")
 
 def demo_recovery_system():
     """Demonstrate recovery orchestration system"""
-    print("\n" + "="*60)
-    print("RECOVERY ORCHESTRATION DEMONSTRATION")
-    print("="*60)
+    _section("RECOVERY ORCHESTRATION DEMONSTRATION")
+    if _skipped("recovery system", "recovery.recovery_orchestrator"):
+        return
     
     try:
-        from recovery.recovery_orchestrator import RecoveryOrchestrator
-        
         # Initialize recovery orchestrator
-        orchestrator = RecoveryOrchestrator()
-        print("✓ Recovery orchestration system initialized")
+        orchestrator = registry.get_orchestrator()
+        logger.info("✓ Recovery orchestration system initialized")
         
         # Start database recovery
         recovery_id = orchestrator.initiate_recovery(
             incident_id="DEMO-2025-001",
             system_type="database"
         )
-        print(f"✓ Database recovery initiated: {recovery_id}")
-        
-        # Monitor recovery progress
-        for i in range(3):  # Monitor for 15 seconds
-            time.sleep(5)
+        logger.info(f"✓ Database recovery initiated: {recovery_id}")
+        
+        # Wait up to 15 seconds for the recovery to finish, reporting
+        # progress at growing intervals (1, 2, 4, 8s); the wait returns as
+        # soon as the recovery completes or fails
+        done = orchestrator.recovery_done_event(recovery_id)
+        backoff, elapsed = 1, 0
+        while True:
+            completed = done.wait(timeout=backoff)
+            elapsed += backoff
             status = orchestrator.get_recovery_status(recovery_id)
             if status:
-                print(f"  Progress: {status['progress_percentage']:.1f}% ({status['completed_tasks']}/{status['total_tasks']} tasks)")
-                if status['status'] == 'completed':
-                    break
+                logger.info(f"  Progress: {status['progress_percentage']:.1f}% ({status['completed_tasks']}/{status['total_tasks']} tasks)")
+            if completed or elapsed >= 15:
+                break
+            backoff = min(backoff * 2, 8, 15 - elapsed)
         
         # Get statistics
         stats = orchestrator.get_statistics()
-        print(f"✓ Recovery statistics: {stats['completed_recoveries']} completed")
+        logger.info(f"✓ Recovery statistics: {stats['completed_recoveries']} completed")
         
     except Exception as e:
-        print(f"✗ Error in recovery system demo: {e}")
+        logger.info(f"✗ Error in recovery system demo: {e}")
 
 def demo_analysis_system():
     """Demonstrate post-incident analysis system"""
-    print("\n" + "="*60)
-    print("POST-INCIDENT ANALYSIS DEMONSTRATION")
-    print("="*60)
+    _section("POST-INCIDENT ANALYSIS DEMONSTRATION")
+    if _skipped("analysis system", "reports.incident_analyzer"):
+        return
     
     try:
-        from reports.incident_analyzer import IncidentAnalyzer
+        now = datetime.now()
         
         # Initialize analyzer
-        analyzer = IncidentAnalyzer()
-        print("✓ Analysis system initialized")
+        analyzer = registry.get_analyzer()
+        logger.info("✓ Analysis system initialized")
         
         # Create test incident data
-        incident_data = {
-            'incident_id': 'DEMO-2025-001',
-            'detection_time': (datetime.now() - timedelta(hours=4)).isoformat(),
-            'response_time': (datetime.now() - timedelta(hours=3, minutes=45)).isoformat(),
-            'containment_time': (datetime.now() - timedelta(hours=3)).isoformat(),
-            'resolution_time': (datetime.now() - timedelta(hours=1)).isoformat(),
-            'severity': 'high',
-            'customer_impact': True,
-            'regulatory_impact': False,
-            'systems_affected': 2,
-            'evidence_items': 15,
-            'tasks_completed': 8,
-            'team_members': ['analyst1', 'commander', 'forensics1']
-        }
+        detection_time = (now - timedelta(hours=4)).isoformat()
+        response_time = (now - timedelta(hours=3, minutes=45)).isoformat()
+        incident_data = asdict(replace(
+            INCIDENT_DATA_TEMPLATE,
+            detection_time=detection_time,
+            response_time=response_time,
+            containment_time=(now - timedelta(hours=3)).isoformat(),
+            resolution_time=(now - timedelta(hours=1)).isoformat()
+        ))
         
         # Calculate metrics
         metrics = analyzer.calculate_incident_metrics(incident_data)
-        print(f"✓ Metrics calculated - Duration: {metrics.total_duration} minutes, Cost: ${metrics.estimated_cost:.2f}")
+        logger.info(f"✓ Metrics calculated - Duration: {metrics.total_duration} minutes, Cost: ${metrics.estimated_cost:.2f}")
         
         # Create test timeline events
         events = [
             {
-                "timestamp": (datetime.now() - timedelta(hours=4)).isoformat(),
+                "timestamp": detection_time,
                 "event_type": "detection",
                 "description": "Threat detected by monitoring system",
                 "actor": "monitoring_system",
@@ -259,7 +330,7 @@ def demo_analysis_system():
                 "impact": "medium"
             },
             {
-                "timestamp": (datetime.now() - timedelta(hours=3, minutes=45)).isoformat(),
+                "timestamp": response_time,
                 "event_type": "response",
                 "description": "Security team alerted",
                 "actor": "security_analyst",
@@ -270,58 +341,45 @@ def demo_analysis_system():
         
         # Analyze timeline
         analysis = analyzer.analyze_incident_timeline("DEMO-2025-001", events)
-        print(f"✓ Timeline analysis completed - Duration: {analysis['duration_hours']:.1f} hours")
+        logger.info(f"✓ Timeline analysis completed - Duration: {analysis['duration_hours']:.1f} hours")
         
         # Generate executive summary
         exec_brief = analyzer.generate_executive_brief(
-            start_date=datetime.now() - timedelta(days=30),
-            end_date=datetime.now()
+            start_date=now - timedelta(days=30),
+            end_date=now
         )
-        print(f"✓ Executive summary generated - Risk level: {exec_brief['executive_summary']['risk_level']}")
+        logger.info(f"✓ Executive summary generated - Risk level: {exec_brief['executive_summary']['risk_level']}")
         
     except Exception as e:
-        print(f"✗ Error in analysis system demo: {e}")
+        logger.info(f"✗ Error in analysis system demo: {e}")
 
 def demo_assessment_tools():
     """Demonstrate security assessment tools"""
-    print("\n" + "="*60)
-    print("SECURITY ASSESSMENT DEMONSTRATION")
-    print("="*60)
+    _section("SECURITY ASSESSMENT DEMONSTRATION")
+    if _skipped("assessment tools", "assessment.pentest_toolkit"):
+        return
     
     try:
-        from assessment.pentest_toolkit import PentestPreparation
+        now = datetime.now()
         
         # Initialize assessment toolkit
-        toolkit = PentestPreparation()
-        print("✓ Security assessment toolkit initialized")
-        
-        # Create test target
-        target_info = {
-            "name": "Demo Web Application",
-            "description": "Test target for penetration testing demo",
-            "ip_addresses": ["127.0.0.1"],
-            "domains": ["demo.example.com"],
-            "ports": [80, 443, 22],
-            "contact_info": {
-                "primary_contact": "demo@example.com",
-                "backup_contact": "backup@example.com"
-            }
-        }
+        toolkit = registry.get_pentest_toolkit()
+        logger.info("✓ Security assessment toolkit initialized")
         
         # Create penetration test plan
         plan_id = toolkit.create_pentest_plan(
             test_type="web_application_test",
-            target_info=target_info,
-            start_date=datetime.now() + timedelta(days=1),
+            target_info=asdict(TARGET_INFO),
+            start_date=now + timedelta(days=1),
             duration_days=3
         )
-        print(f"✓ Penetration test plan created: {plan_id}")
+        logger.info(f"✓ Penetration test plan created: {plan_id}")
         
         # Run network scan (simulated)
         scan_results = {
             "scan_id": "DEMO-SCAN-001",
             "target": "127.0.0.1",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "scan_type": "network_reconnaissance",
             "results": {
                 "127.0.0.1": {
@@ -329,100 +387,239 @@ def demo_assessment_tools():
                     "hostname": "localhost",
                     "state": "up",
                     "services": {
-                        80: {"name": "http", "version": "Apache/2.4.41", "state": "open"},
-                        443: {"name": "https", "version": "Apache/2.4.41", "state": "open"},
-                        22: {"name": "ssh", "version": "OpenSSH 8.0", "state": "open"}
+                        port: {"name": name, "version": version, "state": "open"}
+                        for port, (name, version) in SERVICE_TABLE.items()
                     }
                 }
             }
         }
-        print(f"✓ Network scan completed - {len(scan_results['results'])} hosts found")
+        logger.info(f"✓ Network scan completed - {len(scan_results['results'])} hosts found")
         
         # Generate vulnerability report
         vuln_report = toolkit.generate_vulnerability_report(scan_results)
-        print(f"✓ Vulnerability report generated - {len(vuln_report['vulnerabilities'])} findings")
+        logger.info(f"✓ Vulnerability report generated - {len(vuln_report['vulnerabilities'])} findings")
         
         # Create executive summary
         exec_summary = toolkit.create_executive_summary(vuln_report)
-        print(f"✓ Executive summary created - Risk level: {exec_summary['executive_summary']['overall_risk_level']}")
+        logger.info(f"✓ Executive summary created - Risk level: {exec_summary['executive_summary']['overall_risk_level']}")
         
     except Exception as e:
-        print(f"✗ Error in assessment tools demo: {e}")
+        logger.info(f"✗ Error in assessment tools demo: {e}")
+
+@dataclass
+class WorkflowStage:
+    """One stage of the end-to-end incident workflow"""
+    message: str
+    stage_fn: Callable[[Dict[str, Any]], Dict[str, Any]]
+
+def _simulated(step):
+    """Stage function standing in for a subsystem call; it only records
+    step in the incident context"""
+    def stage_fn(context):
+        return {**context, "completed": context.get("completed", ()) + (step,)}
+    return stage_fn
+
+WORKFLOW_STAGES = (
+    WorkflowStage("1. Threat detected and classified", _simulated("detection")),
+    WorkflowStage("2. Alert generated and routed", _simulated("alerting")),
+    WorkflowStage("3. Incident created and assigned", _simulated("incident")),
+    WorkflowStage("4. Evidence collected and secured", _simulated("evidence")),
+    WorkflowStage("5. Recovery procedures executed", _simulated("recovery")),
+    WorkflowStage("6. Post-incident analysis completed", _simulated("analysis")),
+    WorkflowStage("7. Comprehensive report generated", _simulated("reporting")),
+)
+
+def workflow_pipeline(incident_id, stages=WORKFLOW_STAGES):
+    """Run the workflow stages in order, yielding (stage, context) as each
+    one completes.
+    
+    Each stage function gets the incident context returned by the stage
+    before it, so the stages run one after another in the caller's thread.
+    """
+    context = {"incident_id": incident_id}
+    for stage in stages:
+        context = stage.stage_fn(context)
+        yield stage, context
 
 def demo_integration_workflow():
     """Demonstrate end-to-end integration workflow"""
-    print("\n" + "="*60)
-    print("INTEGRATION WORKFLOW DEMONSTRATION")
-    print("="*60)
+    _section("INTEGRATION WORKFLOW DEMONSTRATION")
     
     try:
-        # This would demonstrate the full integration
-        # For demo purposes, we'll simulate the workflow
-        
-        print("✓ Simulating complete incident workflow:")
-        
-        # 1. Threat detection
-        print("  1. Threat detected and classified")
-        
-        # 2. Alert generation
-        print("  2. Alert generated and routed")
-        
-        # 3. Incident creation
-        print("  3. Incident created and assigned")
-        
-        # 4. Evidence collection
-        print("  4. Evidence collected and secured")
+        # The stages are simulated; see WORKFLOW_STAGES
+        logger.info("✓ Simulating complete incident workflow:")
         
-        # 5. Recovery procedures
-        print("  5. Recovery procedures executed")
+        for stage, _ in workflow_pipeline("DEMO-2025-001"):
+            logger.info(f"  {stage.message}")
         
-        # 6. Post-incident analysis
-        print("  6. Post-incident analysis completed")
-        
-        # 7. Documentation
-        print("  7. Comprehensive report generated")
-        
-        print("✓ End-to-end workflow simulation completed")
+        logger.info("✓ End-to-end workflow simulation completed")
         
     except Exception as e:
-        print(f"✗ Error in integration workflow demo: {e}")
+        logger.info(f"✗ Error in integration workflow demo: {e}")
+
+class _DemoOutput(io.TextIOBase):
+    """Output stream giving each demo thread its own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def capture(self, demo):
+        """Run demo in the calling thread and return what it printed"""
+        self._local.buffer = io.StringIO()
+        try:
+            demo()
+            return self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+# Demo output is logged unformatted to stdout through _output rather than
+# through the timestamped root handler the subsystems log to. Records from a
+# demo are held in that demo's buffer and written out in one piece; a
+# logging.MemoryHandler is not used because its shared buffer would be
+# flushed from whichever thread fills it, mixing the demos' output.
+_output = _DemoOutput(sys.stdout)
+_output_handler = logging.StreamHandler(_output)
+_output_handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(_output_handler)
+logger.propagate = False
+
+# Subsystem modules imported by the demos, with the third-party modules
+# each one imports at load time
+SUBSYSTEM_MODULES = {
+    "threat_detection.threat_detector": ("psutil",),
+    "alerts.alert_manager": (),
+    "evidence.evidence_collector": ("psutil",),
+    "recovery.recovery_orchestrator": ("psutil",),
+    "reports.incident_analyzer": ("matplotlib", "seaborn", "pandas"),
+    "assessment.pentest_toolkit": ("requests", "nmap"),
+}
+
+# Subsystem module -> the modules it needs that cannot be found, filled in
+# by probe_subsystems()
+MISSING_MODULES = {}
+
+def _module_available(name):
+    """Check whether a module can be found, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        # A parent package is missing
+        return False
+
+def probe_subsystems(subsystems=SUBSYSTEM_MODULES):
+    """Record which subsystems are missing their module or a dependency"""
+    for module, dependencies in subsystems.items():
+        MISSING_MODULES[module] = [
+            name for name in (module, *dependencies) if not _module_available(name)
+        ]
+
+def _skipped(demo_name, module):
+    """Log a skip notice and return True if a subsystem cannot be imported"""
+    if module not in MISSING_MODULES:
+        probe_subsystems({module: SUBSYSTEM_MODULES[module]})
+    missing = MISSING_MODULES[module]
+    if missing:
+        logger.info(f"⊘ Skipping {demo_name} demo: {', '.join(missing)} unavailable")
+    return bool(missing)
+
+def preload_subsystems(modules=SUBSYSTEM_MODULES):
+    """Import the subsystem modules concurrently.
+    
+    The imports done by the demos and the registry then find their module
+    in sys.modules. A module that fails to import is left for its demo to
+    import again and report the error.
+    """
+    if not modules:
+        return
+    
+    with ThreadPoolExecutor(max_workers=len(modules)) as executor:
+        for module in modules:
+            executor.submit(importlib.import_module, module)
+
+DEMOS = (
+    demo_threat_detection,
+    demo_alert_system,
+    demo_evidence_collection,
+    demo_recovery_system,
+    demo_analysis_system,
+    demo_assessment_tools,
+    demo_integration_workflow,
+)
+
+def run_demos(demos=DEMOS):
+    """Run the demonstrations concurrently.
+    
+    The demos share nothing but stdout, so each runs in its own thread and
+    its output is printed in order once it and the demos before it finish;
+    the total time is that of the slowest demo rather than the sum.
+    """
+    with ThreadPoolExecutor(max_workers=len(demos)) as executor:
+        for text in executor.map(_output.capture, demos):
+            _output.stream.write(text)
+
+# Statistics reported in the summary:
+# component -> (registry getter, statistics key, description)
+STATISTICS_SOURCES = {
+    "Threat Detection Engine": (registry.get_detector, "total_events", "events processed"),
+    "Alert Management System": (registry.get_alert_manager, "active_alerts", "active alerts"),
+    "Evidence Collection System": (registry.get_collector, "total_collected", "items collected"),
+    "Recovery Orchestration": (registry.get_orchestrator, "completed_recoveries", "recoveries completed"),
+}
+
+def gather_statistics(sources=STATISTICS_SOURCES):
+    """Collect the statistics of every component a demo started.
+    
+    The get_statistics calls are independent, some querying a database, so
+    they run in parallel. Components that were never created, or whose
+    statistics fail, are left out.
+    """
+    started = {
+        name: getter() for name, (getter, _, _) in sources.items()
+        if getter.cache_info().currsize
+    }
+    if not started:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=len(started)) as executor:
+        futures = {name: executor.submit(instance.get_statistics) for name, instance in started.items()}
+    
+    statistics = {}
+    for name, future in futures.items():
+        if future.exception() is None:
+            statistics[name] = future.result()
+    return statistics
 
 def main():
     """Main demonstration function"""
-    print("SECURITY INCIDENT RESPONSE SYSTEM")
-    print("Comprehensive Demonstration")
-    print("="*60)
+    logger.info(f"SECURITY INCIDENT RESPONSE SYSTEM\nComprehensive Demonstration\n{_BANNER}")
     
     start_time = time.time()
     
-    # Run demonstrations
-    demo_threat_detection()
-    demo_alert_system()
-    demo_evidence_collection()
-    demo_recovery_system()
-    demo_analysis_system()
-    demo_assessment_tools()
-    demo_integration_workflow()
+    # Run demonstrations, skipping those whose subsystem cannot be imported
+    probe_subsystems()
+    preload_subsystems([module for module, missing in MISSING_MODULES.items() if not missing])
+    run_demos()
     
     # Summary
     total_time = time.time() - start_time
-    print("\n" + "="*60)
-    print("DEMONSTRATION SUMMARY")
-    print("="*60)
-    print(f"✓ All component demonstrations completed")
-    print(f"✓ Total demonstration time: {total_time:.1f} seconds")
-    print(f"✓ System components tested:")
-    print(f"  - Threat Detection Engine")
-    print(f"  - Alert Management System")
-    print(f"  - Evidence Collection System")
-    print(f"  - Recovery Orchestration")
-    print(f"  - Post-Incident Analysis")
-    print(f"  - Security Assessment Tools")
-    print(f"  - Integration Workflow")
-    
-    print("\n🔒 Security Incident Response System Ready for Production")
-    print("📊 For dashboard access, run: cd dashboard/incident-dashboard && npm run dev")
-    print("📖 For full documentation, see: README.md")
+    statistics = gather_statistics()
+    statistics_lines = "".join(
+        f"✓ {name}: {statistics[name].get(key, 0)} {description}\n"
+        for name, (_, key, description) in STATISTICS_SOURCES.items()
+        if name in statistics
+    )
+    _section("DEMONSTRATION SUMMARY")
+    logger.info(f"✓ All component demonstrations completed\n"
+                f"✓ Total demonstration time: {total_time:.1f} seconds\n"
+                f"{statistics_lines}{_SUMMARY}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,10 +9,12 @@ import os
 import sys
 import logging
 import argparse
+import heapq
 import threading
 import time
+from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import signal
 import queue
 
@@ -52,13 +54,120 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds an incident may stay new or investigating before it is escalated
+ESCALATION_THRESHOLDS = {
+    "critical": 900,   # 15 minutes
+    "high": 3600,      # 1 hour
+    "medium": 14400,   # 4 hours
+    "low": 86400       # 24 hours
+}
+
+# Incident types for which evidence is collected automatically
+EVIDENCE_INCIDENT_TYPES = {"data_breach", "malware", "network_intrusion"}
+
+class ShardedIncidentStore:
+    """Incidents by id, split across shards that each have their own lock
+    
+    The monitoring thread, reports and status queries touch incidents
+    concurrently; a lock per shard keeps them from contending on one lock.
+    Reads return copies taken under the shard lock, so they can be used
+    while the incident changes; all changes go through set or update.
+    """
+    
+    def __init__(self, shards: int = 16):
+        # A power of two, so the shard is picked with a mask
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError(f"shards must be a power of two, got {shards}")
+        self._mask = shards - 1
+        self._shards = [({}, threading.Lock()) for _ in range(shards)]
+    
+    def _shard(self, incident_id: str):
+        return self._shards[hash(incident_id) & self._mask]
+    
+    @staticmethod
+    def _copy(incident: Dict[str, Any]) -> Dict[str, Any]:
+        # Lists (timeline, evidence_items, ...) are appended to in place,
+        # so they are copied too; their entries are not modified
+        return {key: list(value) if isinstance(value, list) else value
+                for key, value in incident.items()}
+    
+    def get(self, incident_id: str, default: Any = None) -> Any:
+        incidents, lock = self._shard(incident_id)
+        with lock:
+            incident = incidents.get(incident_id)
+            return default if incident is None else self._copy(incident)
+    
+    def set(self, incident_id: str, incident: Dict[str, Any]):
+        incidents, lock = self._shard(incident_id)
+        with lock:
+            incidents[incident_id] = incident
+    
+    def update(self, incident_id: str, fn: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Apply fn to an incident under its shard lock and return its
+        result; None if the incident does not exist"""
+        incidents, lock = self._shard(incident_id)
+        with lock:
+            incident = incidents.get(incident_id)
+            if incident is None:
+                return None
+            return fn(incident)
+    
+    def __getitem__(self, incident_id: str) -> Dict[str, Any]:
+        incidents, lock = self._shard(incident_id)
+        with lock:
+            return self._copy(incidents[incident_id])
+    
+    def __contains__(self, incident_id: str) -> bool:
+        incidents, lock = self._shard(incident_id)
+        with lock:
+            return incident_id in incidents
+    
+    def __len__(self) -> int:
+        return sum(len(incidents) for incidents, _ in self._shards)
+    
+    def __iter__(self):
+        incident_ids = []
+        for incidents, lock in self._shards:
+            with lock:
+                incident_ids.extend(incidents)
+        return iter(incident_ids)
+    
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Snapshot of (incident_id, incident) pairs, one shard at a time"""
+        snapshot = []
+        for incidents, lock in self._shards:
+            with lock:
+                snapshot.extend(
+                    (incident_id, self._copy(incident))
+                    for incident_id, incident in incidents.items()
+                )
+        return snapshot
+    
+    def values(self) -> List[Dict[str, Any]]:
+        """Snapshot of the incidents, one shard at a time"""
+        return [incident for _, incident in self.items()]
+
 class IncidentResponseOrchestrator:
     """Main orchestrator for the incident response system"""
     
     def __init__(self, config_dir: str = "config"):
         self.config_dir = config_dir
         self.running = False
-        self.incidents = {}
+        # Set on shutdown so the monitoring thread wakes immediately
+        self._stop_event = threading.Event()
+        self.incidents = ShardedIncidentStore()
+        
+        # Incidents each integration check still has to act on, so a check
+        # only looks at those instead of every incident on every tick.
+        # _pending_lock guards these and _escalation_heap, which callers add
+        # to while the monitoring thread drains them.
+        self._pending_evidence = set()
+        self._pending_recovery = set()
+        self._pending_analysis = set()
+        # (escalation deadline timestamp, incident_id)
+        self._escalation_heap = []
+        self._pending_lock = threading.Lock()
+        
         self.system_status = {
             "threat_detection": False,
             "alert_system": False,
@@ -70,6 +179,13 @@ class IncidentResponseOrchestrator:
         # Initialize components
         self._initialize_components()
         
+        # Alerts acknowledged or resolved since the alert queue was last
+        # processed, pushed by the alert manager's callbacks
+        self._alert_updates = queue.SimpleQueue()
+        if self.system_status["alert_system"]:
+            self.alert_manager.register_acknowledgment_callback(self._alert_updates.put)
+            self.alert_manager.register_resolution_callback(self._alert_updates.put)
+        
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -143,97 +259,81 @@ class IncidentResponseOrchestrator:
             return
         
         self.running = True
+        self._stop_event.clear()
         logger.info("Starting incident response monitoring system...")
         
-        # Start background monitoring threads
-        self._start_background_monitoring()
-        
-        # Start integration monitoring
-        self._start_integration_monitoring()
-        
-        # Start system health monitoring
-        self._start_health_monitoring()
+        # Start the monitoring thread
+        self._start_monitoring_scheduler()
         
         logger.info("Incident response system is now running")
     
-    def _start_background_monitoring(self):
-        """Start background monitoring threads"""
+    def _start_monitoring_scheduler(self):
+        """Run all periodic monitoring tasks on one background thread
+        
+        Each task is (name, callback, interval, retry interval); the thread
+        sleeps until the earliest task is due, runs it, and schedules it
+        again after its interval, or its retry interval if it raised.
+        """
+        tasks = []
         
         # Threat detection monitoring
         if self.system_status["threat_detection"]:
-            def threat_monitoring():
-                while self.running:
-                    try:
-                        # Process threat detection events
-                        self._process_threat_events()
-                        time.sleep(10)
-                    except Exception as e:
-                        logger.error(f"Error in threat monitoring: {e}")
-                        time.sleep(30)
-            
-            thread = threading.Thread(target=threat_monitoring, daemon=True)
-            thread.start()
+            tasks.append(("threat monitoring", self._process_threat_events, 10, 30))
         
         # Alert processing
         if self.system_status["alert_system"]:
-            def alert_monitoring():
-                while self.running:
-                    try:
-                        # Process alert queue
-                        self._process_alert_queue()
-                        time.sleep(5)
-                    except Exception as e:
-                        logger.error(f"Error in alert monitoring: {e}")
-                        time.sleep(15)
-            
-            thread = threading.Thread(target=alert_monitoring, daemon=True)
-            thread.start()
-    
-    def _start_integration_monitoring(self):
-        """Start integration between system components"""
-        
-        def integration_monitoring():
+            tasks.append(("alert monitoring", self._process_alert_queue, 5, 15))
+        
+        # Integration between system components
+        tasks.append(("integration monitoring", self._run_integration_checks, 30, 60))
+        
+        # System health, every 5 minutes
+        tasks.append(("health monitoring", self._check_system_health, 300, 300))
+        
+        def monitoring_loop():
+            # (next run, task index, task); every task runs once at start
+            now = time.monotonic()
+            schedule = [(now, index, task) for index, task in enumerate(tasks)]
+            heapq.heapify(schedule)
+            
             while self.running:
+                next_run, index, task = schedule[0]
+                if self._stop_event.wait(max(0.0, next_run - time.monotonic())):
+                    break
+                heapq.heappop(schedule)
+                
+                name, callback, interval, retry_interval = task
                 try:
-                    # Monitor for incidents that need escalation
-                    self._check_incident_escalation()
-                    
-                    # Monitor for evidence collection triggers
-                    self._check_evidence_collection_triggers()
-                    
-                    # Monitor for recovery triggers
-                    self._check_recovery_triggers()
-                    
-                    # Monitor for analysis triggers
-                    self._check_analysis_triggers()
-                    
-                    time.sleep(30)  # Check every 30 seconds
-                    
+                    callback()
+                    delay = interval
                 except Exception as e:
-                    logger.error(f"Error in integration monitoring: {e}")
-                    time.sleep(60)
+                    logger.error(f"Error in {name}: {e}")
+                    delay = retry_interval
+                
+                heapq.heappush(schedule, (time.monotonic() + delay, index, task))
         
-        thread = threading.Thread(target=integration_monitoring, daemon=True)
+        thread = threading.Thread(target=monitoring_loop, daemon=True)
         thread.start()
     
-    def _start_health_monitoring(self):
-        """Start system health monitoring"""
+    def _run_integration_checks(self):
+        """Run the checks that hand incidents between system components"""
+        # Monitor for incidents that need escalation
+        self._check_incident_escalation()
         
-        def health_monitoring():
-            while self.running:
-                try:
-                    health_status = self.get_system_health()
-                    if not all(health_status.values()):
-                        logger.warning(f"System health issues detected: {health_status}")
-                    
-                    time.sleep(300)  # Check every 5 minutes
-                    
-                except Exception as e:
-                    logger.error(f"Error in health monitoring: {e}")
-                    time.sleep(300)
+        # Monitor for evidence collection triggers
+        self._check_evidence_collection_triggers()
         
-        thread = threading.Thread(target=health_monitoring, daemon=True)
-        thread.start()
+        # Monitor for recovery triggers
+        self._check_recovery_triggers()
+        
+        # Monitor for analysis triggers
+        self._check_analysis_triggers()
+    
+    def _check_system_health(self):
+        """Log a warning if any system component is unavailable"""
+        health_status = self.get_system_health()
+        if not all(health_status.values()):
+            logger.warning(f"System health issues detected: {health_status}")
     
     def _process_threat_events(self):
         """Process events from threat detection system"""
@@ -281,8 +381,12 @@ class IncidentResponseOrchestrator:
             ]
         }
         
-        # Store incident
-        self.incidents[incident_id] = incident
+        # Store incident and queue its integration triggers
+        self.incidents.set(incident_id, incident)
+        self._schedule_escalation(incident_id)
+        if incident["type"] in EVIDENCE_INCIDENT_TYPES:
+            with self._pending_lock:
+                self._pending_evidence.add(incident_id)
         
         # Create alert
         if self.system_status["alert_system"]:
@@ -298,7 +402,7 @@ class IncidentResponseOrchestrator:
                         "risk_score": event.risk_score
                     }
                 )
-                incident['initial_alert_id'] = alert.id
+                self._update_incident(incident_id, initial_alert_id=alert.id)
             except Exception as e:
                 logger.error(f"Failed to create alert for incident {incident_id}: {e}")
         
@@ -310,72 +414,136 @@ class IncidentResponseOrchestrator:
             return
         
         try:
-            # Get active alerts
-            active_alerts = self.alert_manager.get_active_alerts()
+            # Take the alerts that changed status since the last run
+            updated_alerts = []
+            while True:
+                try:
+                    updated_alerts.append(self._alert_updates.get_nowait())
+                except queue.Empty:
+                    break
             
-            for alert in active_alerts:
+            for alert in updated_alerts:
                 incident_id = alert.metadata.get("incident_id")
                 
-                if incident_id and incident_id in self.incidents:
-                    incident = self.incidents[incident_id]
-                    
-                    # Update incident based on alert status
-                    if alert.status == AlertStatus.ACKNOWLEDGED:
-                        if incident["status"] == "new":
-                            incident["status"] = "investigating"
-                            incident["assigned_to"] = alert.assigned_to
-                            self._add_timeline_event(incident_id, "investigating", "Incident acknowledged by response team", "system")
-                    
-                    elif alert.status == AlertStatus.RESOLVED:
-                        if incident["status"] != "resolved":
-                            incident["status"] = "resolved"
-                            incident["resolved_at"] = datetime.now().isoformat()
-                            self._add_timeline_event(incident_id, "resolved", "Alert resolved, incident under review", "system")
-                            
-                            # Trigger post-incident analysis
-                            self._trigger_post_incident_analysis(incident_id)
+                if not incident_id:
+                    continue
+                
+                # Update incident based on alert status
+                if alert.status == AlertStatus.ACKNOWLEDGED:
+                    if self.update_incident_status(
+                            incident_id, "investigating",
+                            when=lambda incident: incident["status"] == "new",
+                            assigned_to=alert.assigned_to):
+                        self._add_timeline_event(incident_id, "investigating", "Incident acknowledged by response team", "system")
+                
+                elif alert.status == AlertStatus.RESOLVED:
+                    if self.update_incident_status(
+                            incident_id, "resolved",
+                            when=lambda incident: incident["status"] != "resolved",
+                            resolved_at=datetime.now().isoformat()):
+                        self._add_timeline_event(incident_id, "resolved", "Alert resolved, incident under review", "system")
+                        
+                        # Trigger post-incident analysis
+                        if self._trigger_post_incident_analysis(incident_id):
+                            with self._pending_lock:
+                                self._pending_analysis.discard(incident_id)
         
         except Exception as e:
             logger.error(f"Error processing alert queue: {e}")
     
+    def update_incident_status(self, incident_id: str, status: str,
+                               when: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                               **fields) -> bool:
+        """Set an incident's status and queue the triggers it enables
+        
+        The status and any extra fields are set together under the
+        incident's shard lock, and only if when(incident) holds, when given.
+        Returns whether the incident was updated. Recovery starts for
+        contained incidents and post-incident analysis for resolved ones;
+        status changes must go through here for the integration checks to
+        see them.
+        """
+        def set_status(incident):
+            if when is not None and not when(incident):
+                return False
+            incident["status"] = status
+            incident.update(fields)
+            return True
+        if not self.incidents.update(incident_id, set_status):
+            return False
+        
+        with self._pending_lock:
+            if status == "contained":
+                self._pending_recovery.add(incident_id)
+            elif status == "resolved":
+                self._pending_analysis.add(incident_id)
+        return True
+    
+    def _update_incident(self, incident_id: str, **fields):
+        """Set fields of an incident under its shard lock"""
+        self.incidents.update(incident_id, lambda incident: incident.update(fields))
+    
+    def _pending_snapshot(self, pending: set) -> List[str]:
+        """Ids in one of the _pending_* sets, copied under _pending_lock"""
+        with self._pending_lock:
+            return list(pending)
+    
+    def _discard_pending(self, pending: set, incident_id: str):
+        """Remove an incident from one of the _pending_* sets"""
+        with self._pending_lock:
+            pending.discard(incident_id)
+    
+    def _schedule_escalation(self, incident_id: str):
+        """Queue an incident for an escalation check once its severity's
+        response time has passed"""
+        incident = self.incidents[incident_id]
+        threshold = ESCALATION_THRESHOLDS.get(incident["severity"], 86400)
+        deadline = datetime.fromisoformat(incident["created_at"]).timestamp() + threshold
+        with self._pending_lock:
+            heapq.heappush(self._escalation_heap, (deadline, incident_id))
+    
     def _check_incident_escalation(self):
         """Check for incidents that need escalation"""
-        current_time = datetime.now()
-        
-        for incident_id, incident in self.incidents.items():
-            # Check for escalation timeouts
-            created_time = datetime.fromisoformat(incident["created_at"])
-            time_elapsed = (current_time - created_time).total_seconds()
-            
-            # Escalate based on severity and time
-            escalation_thresholds = {
-                "critical": 900,   # 15 minutes
-                "high": 3600,      # 1 hour
-                "medium": 14400,   # 4 hours
-                "low": 86400       # 24 hours
-            }
-            
-            threshold = escalation_thresholds.get(incident["severity"], 86400)
+        current_time = time.time()
+        
+        # Only incidents whose escalation deadline has passed
+        due = []
+        with self._pending_lock:
+            while self._escalation_heap and self._escalation_heap[0][0] < current_time:
+                due.append(heapq.heappop(self._escalation_heap))
+        
+        retry = []
+        for deadline, incident_id in due:
+            incident = self.incidents.get(incident_id)
             
-            if (time_elapsed > threshold and 
+            if (incident and
                 incident["status"] in ["new", "investigating"] and
                 not incident.get("escalated", False)):
                 
-                self._escalate_incident(incident_id)
+                # Retry on the next check if escalation failed
+                if not self._escalate_incident(incident_id):
+                    retry.append((deadline, incident_id))
+        
+        with self._pending_lock:
+            for entry in retry:
+                heapq.heappush(self._escalation_heap, entry)
     
     def _check_evidence_collection_triggers(self):
         """Check for evidence collection triggers"""
         if not self.system_status["evidence_collector"]:
             return
         
-        for incident_id, incident in self.incidents.items():
-            # Check if evidence should be collected based on incident type
-            if incident["type"] in ["data_breach", "malware", "network_intrusion"]:
-                if not incident.get("evidence_collected", False):
-                    self._trigger_evidence_collection(incident_id)
+        for incident_id in self._pending_snapshot(self._pending_evidence):
+            incident = self.incidents.get(incident_id)
+            
+            # Failed collections stay pending and are retried
+            if (incident is None
+                    or incident.get("evidence_collected", False)
+                    or self._trigger_evidence_collection(incident_id)):
+                self._discard_pending(self._pending_evidence, incident_id)
     
-    def _trigger_evidence_collection(self, incident_id):
-        """Trigger evidence collection for incident"""
+    def _trigger_evidence_collection(self, incident_id) -> bool:
+        """Trigger evidence collection for incident; returns whether it succeeded"""
         incident = self.incidents[incident_id]
         
         try:
@@ -401,28 +569,39 @@ class IncidentResponseOrchestrator:
                 )
             
             # Mark evidence as collected
-            incident["evidence_collected"] = True
-            incident["evidence_items"].append(evidence.id)
+            def record_evidence(incident):
+                incident["evidence_collected"] = True
+                incident["evidence_items"].append(evidence.id)
+            self.incidents.update(incident_id, record_evidence)
             
             logger.info(f"Evidence collection triggered for incident {incident_id}")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to collect evidence for incident {incident_id}: {e}")
+            return False
     
     def _check_recovery_triggers(self):
         """Check for recovery system triggers"""
         if not self.system_status["recovery_system"]:
             return
         
-        for incident_id, incident in self.incidents.items():
+        for incident_id in self._pending_snapshot(self._pending_recovery):
+            incident = self.incidents.get(incident_id)
+            if incident is None:
+                self._discard_pending(self._pending_recovery, incident_id)
+                continue
+            
             # Trigger recovery for system-affecting incidents
-            if (incident["status"] == "contained" and 
-                not incident.get("recovery_initiated", False)):
-                
-                self._trigger_recovery(incident_id)
+            initiated = incident.get("recovery_initiated", False)
+            if incident["status"] == "contained" and not initiated:
+                initiated = self._trigger_recovery(incident_id)
+            
+            if incident["status"] != "contained" or initiated:
+                self._discard_pending(self._pending_recovery, incident_id)
     
-    def _trigger_recovery(self, incident_id):
-        """Trigger recovery procedures for incident"""
+    def _trigger_recovery(self, incident_id) -> bool:
+        """Trigger recovery procedures for incident; returns whether it was initiated"""
         incident = self.incidents[incident_id]
         
         try:
@@ -435,28 +614,37 @@ class IncidentResponseOrchestrator:
                     system_type=system_type
                 )
                 
-                incident["recovery_id"] = recovery_id
-                incident["recovery_initiated"] = True
+                self._update_incident(incident_id, recovery_id=recovery_id, recovery_initiated=True)
                 
                 logger.info(f"Recovery initiated for incident {incident_id} - {system_type}")
+                return True
             
         except Exception as e:
             logger.error(f"Failed to initiate recovery for incident {incident_id}: {e}")
+        
+        return False
     
     def _check_analysis_triggers(self):
         """Check for post-incident analysis triggers"""
         if not self.system_status["analysis_system"]:
             return
         
-        for incident_id, incident in self.incidents.items():
+        for incident_id in self._pending_snapshot(self._pending_analysis):
+            incident = self.incidents.get(incident_id)
+            if incident is None:
+                self._discard_pending(self._pending_analysis, incident_id)
+                continue
+            
             # Trigger analysis when incident is resolved
-            if (incident["status"] == "resolved" and 
-                not incident.get("analysis_completed", False)):
-                
-                self._trigger_post_incident_analysis(incident_id)
+            completed = incident.get("analysis_completed", False)
+            if incident["status"] == "resolved" and not completed:
+                completed = self._trigger_post_incident_analysis(incident_id)
+            
+            if incident["status"] != "resolved" or completed:
+                self._discard_pending(self._pending_analysis, incident_id)
     
-    def _trigger_post_incident_analysis(self, incident_id):
-        """Trigger post-incident analysis"""
+    def _trigger_post_incident_analysis(self, incident_id) -> bool:
+        """Trigger post-incident analysis; returns whether it completed"""
         incident = self.incidents[incident_id]
         
         try:
@@ -479,16 +667,21 @@ class IncidentResponseOrchestrator:
             lessons = self.incident_analyzer.generate_lessons_learned(incident_id, {}, metrics)
             
             # Mark analysis as completed
-            incident["analysis_completed"] = True
-            incident["lessons_learned"] = [asdict(lesson) for lesson in lessons]
+            self._update_incident(
+                incident_id,
+                analysis_completed=True,
+                lessons_learned=[asdict(lesson) for lesson in lessons]
+            )
             
             logger.info(f"Post-incident analysis completed for {incident_id}")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to complete post-incident analysis for {incident_id}: {e}")
+            return False
     
-    def _escalate_incident(self, incident_id):
-        """Escalate incident to management"""
+    def _escalate_incident(self, incident_id) -> bool:
+        """Escalate incident to management; returns whether it succeeded"""
         incident = self.incidents[incident_id]
         
         try:
@@ -507,26 +700,26 @@ class IncidentResponseOrchestrator:
                     }
                 )
             
-            incident["escalated"] = True
-            incident["escalated_at"] = datetime.now().isoformat()
+            self._update_incident(incident_id, escalated=True, escalated_at=datetime.now().isoformat())
             
             self._add_timeline_event(incident_id, "escalated", "Incident escalated to management", "system")
             
             logger.warning(f"Incident {incident_id} escalated to management")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to escalate incident {incident_id}: {e}")
+            return False
     
     def _add_timeline_event(self, incident_id, event_type, description, actor):
         """Add event to incident timeline"""
-        if incident_id in self.incidents:
-            event = {
-                "timestamp": datetime.now().isoformat(),
-                "event": event_type,
-                "description": description,
-                "actor": actor
-            }
-            self.incidents[incident_id]["timeline"].append(event)
+        event = {
+            "timestamp": datetime.now().isoformat(),
+            "event": event_type,
+            "description": description,
+            "actor": actor
+        }
+        self.incidents.update(incident_id, lambda incident: incident["timeline"].append(event))
     
     def get_system_health(self) -> Dict[str, bool]:
         """Get current system health status"""
@@ -534,11 +727,12 @@ class IncidentResponseOrchestrator:
     
     def get_incident_summary(self) -> Dict[str, Any]:
         """Get summary of all incidents"""
-        total_incidents = len(self.incidents)
+        incidents = self.incidents.values()
+        total_incidents = len(incidents)
         status_counts = {}
         severity_counts = {}
         
-        for incident in self.incidents.values():
+        for incident in incidents:
             # Count by status
             status = incident["status"]
             status_counts[status] = status_counts.get(status, 0) + 1
@@ -552,7 +746,7 @@ class IncidentResponseOrchestrator:
             "incidents_by_status": status_counts,
             "incidents_by_severity": severity_counts,
             "recent_incidents": len([
-                inc for inc in self.incidents.values()
+                inc for inc in incidents
                 if datetime.fromisoformat(inc["created_at"]) > datetime.now() - timedelta(days=7)
             ])
         }
@@ -563,7 +757,7 @@ class IncidentResponseOrchestrator:
             "report_generated": datetime.now().isoformat(),
             "system_status": self.get_system_health(),
             "incident_summary": self.get_incident_summary(),
-            "incidents": self.incidents
+            "incidents": dict(self.incidents.items())
         }
         
         with open(output_file, 'w') as f:
@@ -577,15 +771,18 @@ class IncidentResponseOrchestrator:
         logger.info("Shutting down incident response system...")
         
         self.running = False
+        self._stop_event.set()
         
         # Shutdown components
         if hasattr(self, 'threat_detector'):
             logger.info("Threat detection system stopped")
         
         if hasattr(self, 'alert_manager'):
+            self.alert_manager.shutdown()
             logger.info("Alert system stopped")
         
         if hasattr(self, 'evidence_collector'):
+            self.evidence_collector.close()
             logger.info("Evidence collector stopped")
         
         if hasattr(self, 'recovery_orchestrator'):
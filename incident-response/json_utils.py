@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+JSON Utilities
+JSON serialization shared by the incident response subsystems
+"""
+
+import json
+from typing import Any
+
+# orjson serializes alert payloads and evidence data several times faster;
+# json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_default(obj: Any) -> Any:
+    # Named tuples (e.g. psutil results) are written as arrays, as json does
+    if isinstance(obj, tuple):
+        return list(obj)
+    return str(obj)
+
+def dumps_json(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when it is installed
+
+    Values neither encoder handles natively are written with str().
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which json handles
+            pass
+    return json.dumps(
+        obj, indent=2 if indent else None, sort_keys=sort_keys, default=str
+    ).encode()
@@ -468,7 +468,10 @@ class RecoveryOrchestrator:
             "status": RecoveryStatus.PENDING,
             "started_at": None,
             "completed_at": None,
-            "task_status": {}
+            "task_status": {},
+            # Set once the recovery completes or fails; see recovery_done_event.
+            # Kept on the instance so it goes away with it
+            "done": threading.Event()
         }
         
         self.active_recoveries[recovery_id] = recovery_instance
@@ -507,14 +510,30 @@ class RecoveryOrchestrator:
         # Sort by priority
         phase_tasks.sort(key=lambda t: t.priority.value)
         
+        # A plan without tasks in this phase goes straight to the next one;
+        # otherwise the recovery would never finish
+        if not phase_tasks:
+            self._check_phase_completion(recovery_id, phase)
+            return
+        
         for task in phase_tasks:
             # Check dependencies
             if not self._check_dependencies(task, recovery):
                 task.status = RecoveryStatus.SKIPPED
+                recovery["task_status"][task.id] = {
+                    "status": RecoveryStatus.SKIPPED,
+                    "started_at": None,
+                    "completed_at": None
+                }
                 continue
             
             # Execute task
             self._execute_recovery_task(recovery_id, task)
+        
+        # A phase left with failed or skipped tasks never completes, so the
+        # recovery cannot move on
+        if recovery["status"] == RecoveryStatus.IN_PROGRESS and not self._phase_completed(recovery, phase):
+            self._finish_recovery(recovery_id, RecoveryStatus.FAILED)
     
     def _check_dependencies(self, task: RecoveryTask, recovery: Dict[str, Any]) -> bool:
         """Check if task dependencies are met"""
@@ -557,6 +576,13 @@ class RecoveryOrchestrator:
             task.status = RecoveryStatus.FAILED
             task.completed_at = datetime.now()
             
+            recovery = self.active_recoveries[recovery_id]
+            recovery["task_status"][task.id] = {
+                "status": RecoveryStatus.FAILED,
+                "started_at": task.started_at,
+                "completed_at": task.completed_at
+            }
+            
             # Call failure callback
             for callback in self.failure_callbacks:
                 try:
@@ -611,25 +637,33 @@ class RecoveryOrchestrator:
     def _check_phase_completion(self, recovery_id: str, phase: RecoveryPhase):
         """Check if a recovery phase is complete"""
         recovery = self.active_recoveries[recovery_id]
-        plan = recovery["plan"]
         
-        # Get all tasks in this phase
-        phase_tasks = [task for task in plan.recovery_tasks if task.phase == phase]
-        
-        # Check if all tasks are completed
-        completed_tasks = [task for task in phase_tasks 
-                          if recovery["task_status"].get(task.id, {}).get("status") == RecoveryStatus.COMPLETED]
-        
-        if len(completed_tasks) == len(phase_tasks):
+        if self._phase_completed(recovery, phase):
             # Phase complete, move to next phase
             next_phase = self._get_next_phase(phase)
             if next_phase:
                 self._execute_recovery_phase(recovery_id, next_phase)
             else:
                 # Recovery complete
-                recovery["status"] = RecoveryStatus.COMPLETED
-                recovery["completed_at"] = datetime.now()
-                logger.info(f"Recovery completed: {recovery_id}")
+                self._finish_recovery(recovery_id, RecoveryStatus.COMPLETED)
+    
+    def _phase_completed(self, recovery: Dict[str, Any], phase: RecoveryPhase) -> bool:
+        """Check if every task of a recovery phase has completed"""
+        return all(
+            recovery["task_status"].get(task.id, {}).get("status") == RecoveryStatus.COMPLETED
+            for task in recovery["plan"].recovery_tasks if task.phase == phase
+        )
+    
+    def _finish_recovery(self, recovery_id: str, status: RecoveryStatus):
+        """Record a recovery's final status and wake its waiters"""
+        recovery = self.active_recoveries[recovery_id]
+        recovery["status"] = status
+        recovery["completed_at"] = datetime.now()
+        recovery["done"].set()
+        if status == RecoveryStatus.COMPLETED:
+            logger.info(f"Recovery completed: {recovery_id}")
+        else:
+            logger.error(f"Recovery {status.value}: {recovery_id}")
     
     def _get_next_phase(self, current_phase: RecoveryPhase) -> Optional[RecoveryPhase]:
         """Get the next phase in the recovery sequence"""
@@ -774,6 +808,15 @@ class RecoveryOrchestrator:
             ]
         }
     
+    def recovery_done_event(self, recovery_id: str) -> Optional[threading.Event]:
+        """Get an event that is set once the recovery completes or fails.
+        
+        Lets callers block until the recovery finishes instead of polling
+        get_recovery_status, which tells which way it went.
+        """
+        recovery = self.active_recoveries.get(recovery_id)
+        return recovery["done"] if recovery else None
+    
     def register_completion_callback(self, callback: Callable[[str, RecoveryTask], None]):
         """Register callback for task completion"""
         self.completion_callbacks.append(callback)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Subsystem Registry
+Shared, lazily created instances of the incident response subsystems
+"""
+
+from functools import lru_cache
+
+# Each getter builds its subsystem on first use and returns the same
+# instance afterwards, so callers share detection rules, alert workers and
+# database handles instead of initialising their own. Imports are local so a
+# subsystem with missing dependencies only fails when it is requested.
+
+@lru_cache(maxsize=1)
+def get_detector():
+    """Get the shared ThreatDetector"""
+    from threat_detection.threat_detector import ThreatDetector
+    return ThreatDetector()
+
+@lru_cache(maxsize=1)
+def get_alert_manager():
+    """Get the shared AlertManager"""
+    from alerts.alert_manager import AlertManager
+    return AlertManager()
+
+@lru_cache(maxsize=1)
+def get_collector():
+    """Get the shared EvidenceCollector"""
+    from evidence.evidence_collector import EvidenceCollector
+    return EvidenceCollector()
+
+@lru_cache(maxsize=1)
+def get_orchestrator():
+    """Get the shared RecoveryOrchestrator"""
+    from recovery.recovery_orchestrator import RecoveryOrchestrator
+    return RecoveryOrchestrator()
+
+@lru_cache(maxsize=1)
+def get_analyzer():
+    """Get the shared IncidentAnalyzer"""
+    from reports.incident_analyzer import IncidentAnalyzer
+    return IncidentAnalyzer()
+
+@lru_cache(maxsize=1)
+def get_pentest_toolkit():
+    """Get the shared PentestPreparation toolkit"""
+    from assessment.pentest_toolkit import PentestPreparation
+    return PentestPreparation()
@@ -4,15 +4,19 @@ Post-Incident Analysis & Reporting System
 Comprehensive incident analysis, lessons learned, and compliance reporting
 """
 
+import copy
+import hashlib
 import json
 import os
 import sqlite3
 import logging
+import threading
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from enum import Enum
 import matplotlib
@@ -22,6 +26,10 @@ matplotlib.use('Agg')  # Use non-interactive backend
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Memoized timeline and metrics results kept; the least recently used are
+# dropped beyond this
+RESULT_CACHE_SIZE = 256
+
 class IncidentCategory(Enum):
     SECURITY_BREACH = "security_breach"
     DATA_LOSS = "data_loss"
@@ -103,6 +111,10 @@ class IncidentAnalyzer:
         # Analysis results cache
         self.analysis_cache = {}
         
+        # Memoized timeline and metrics results by _cache_key, in LRU order
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
         logger.info("Incident Analyzer initialized")
     
     def _init_database(self):
@@ -171,8 +183,40 @@ class IncidentAnalyzer:
         conn.commit()
         conn.close()
     
+    def _cache_key(self, kind: str, *inputs: Any) -> str:
+        """Build a result cache key from a digest of the canonical JSON inputs"""
+        canonical = json.dumps(inputs, sort_keys=True, default=str).encode()
+        return f"{kind}_{hashlib.blake2b(canonical, digest_size=16).hexdigest()}"
+    
+    def _cached_result(self, cache_key: str) -> Any:
+        """Return a copy of a memoized result, or None if it is not cached"""
+        with self._result_cache_lock:
+            result = self._result_cache.get(cache_key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(cache_key)
+        return copy.deepcopy(result)
+    
+    def _cache_result(self, cache_key: str, result: Any):
+        """Memoize a copy of result, evicting the least recently used beyond RESULT_CACHE_SIZE"""
+        result = copy.deepcopy(result)
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = result
+            self._result_cache.move_to_end(cache_key)
+            while len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
     def analyze_incident_timeline(self, incident_id: str, events: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze incident timeline and identify patterns"""
+        """Analyze incident timeline and identify patterns
+        
+        Results are cached per (incident_id, events); repeating the same
+        analysis returns a copy of the cached result without re-saving.
+        """
+        cache_key = self._cache_key("timeline", incident_id, events)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+        
         timeline_events = []
         
         for event_data in events:
@@ -255,6 +299,8 @@ class IncidentAnalyzer:
         # Save timeline events to database
         self._save_timeline_events(incident_id, timeline_events)
         
+        self._cache_result(cache_key, analysis)
+        
         logger.info(f"Timeline analysis completed for {incident_id}")
         return analysis
     
@@ -312,7 +358,15 @@ class IncidentAnalyzer:
         return patterns
     
     def calculate_incident_metrics(self, incident_data: Dict[str, Any]) -> IncidentMetrics:
-        """Calculate comprehensive incident metrics"""
+        """Calculate comprehensive incident metrics
+        
+        Results are cached per incident_data; repeating the same calculation
+        returns a copy of the cached metrics without re-saving.
+        """
+        cache_key = self._cache_key("metrics", incident_data)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
         
         # Extract timestamps
         detection_time = datetime.fromisoformat(incident_data.get('detection_time'))
@@ -373,6 +427,8 @@ class IncidentAnalyzer:
         # Save metrics to database
         self._save_incident_metrics(metrics)
         
+        self._cache_result(cache_key, metrics)
+        
         logger.info(f"Metrics calculated for {metrics.incident_id}")
         return metrics
     
@@ -60,7 +60,7 @@ class ThreatIndicator:
     severity: ThreatLevel
     category: ThreatCategory
 
-@dataclass
+@dataclass(slots=True)
 class SecurityEvent:
     """Represents a security event that may indicate a threat"""
     id: str
@@ -72,6 +72,11 @@ class SecurityEvent:
     threat_indicators: List[ThreatIndicator]
     risk_score: float
     requires_investigation: bool
+    
+    @classmethod
+    def from_batch(cls, records: List[Dict[str, Any]]) -> List["SecurityEvent"]:
+        """Build events from a list of field dicts"""
+        return [cls(**record) for record in records]
 
 class ThreatDetector:
     """Main threat detection engine"""
@@ -81,6 +86,14 @@ class ThreatDetector:
         self.event_queue = queue.Queue()
         self.threat_indicators = {}
         self.detection_rules = self._load_detection_rules()
+        self.process_patterns = [
+            (pattern, re.compile(pattern))
+            for pattern in self.detection_rules["malware_detection"]["process_patterns"]
+        ]
+        self.batch_rule_handlers = {
+            "suspicious_process": self._apply_process_rules_batch,
+            "failed_login": self._apply_failed_login_rules_batch
+        }
         self.baseline_data = {}
         self.active_monitors = {}
         self.event_history = deque(maxlen=10000)
@@ -530,8 +543,36 @@ class ThreatDetector:
         # Run event through detection rules
         self._apply_detection_rules(event)
         
+        self._score_event(event)
+    
+    def process_batch(self, events: List[SecurityEvent]) -> List[SecurityEvent]:
+        """Process a batch of security events through the detection pipeline
+        
+        Events are grouped by event type and each group is handed to its rule
+        handler in one call, so per-rule setup such as counting recent failed
+        logins happens once per batch instead of once per event.
+        """
+        events_by_type = defaultdict(list)
+        for event in events:
+            events_by_type[event.event_type].append(event)
+        
+        indicator_index = self._index_threat_indicators()
+        
+        for event_type, group in events_by_type.items():
+            handler = self.batch_rule_handlers.get(event_type)
+            if handler:
+                handler(group)
+            self.event_history.extend(group)
+            
+            for event in group:
+                self._score_event(event, indicator_index)
+        
+        return events
+    
+    def _score_event(self, event: SecurityEvent, indicator_index=None):
+        """Check indicators, score the event and raise alerts/callbacks"""
         # Check against threat indicators
-        self._check_threat_indicators(event)
+        self._check_threat_indicators(event, indicator_index)
         
         # Calculate final risk score
         self._calculate_risk_score(event)
@@ -550,24 +591,7 @@ class ThreatDetector:
     def _apply_detection_rules(self, event: SecurityEvent):
         """Apply detection rules to the security event"""
         if event.event_type == "suspicious_process":
-            # Check against malware detection rules
-            process_name = event.event_data.get("process_name", "").lower()
-            
-            for pattern in self.detection_rules["malware_detection"]["process_patterns"]:
-                if re.search(pattern, process_name):
-                    indicator = ThreatIndicator(
-                        id=f"malware_pattern_{int(time.time())}",
-                        type="process_pattern",
-                        value=pattern,
-                        source="rule_engine",
-                        confidence=0.8,
-                        timestamp=datetime.now(),
-                        metadata={"event_id": event.id, "process_name": process_name},
-                        severity=ThreatLevel.HIGH,
-                        category=ThreatCategory.MALWARE
-                    )
-                    event.threat_indicators.append(indicator)
-                    event.risk_score = max(event.risk_score, 0.8)
+            self._match_process_patterns(event)
         
         elif event.event_type == "failed_login":
             # Check for brute force patterns
@@ -579,35 +603,101 @@ class ThreatDetector:
             ]
             
             if len(recent_failures) >= 5:  # Threshold for brute force
-                event.risk_score = 0.7
-                event.requires_investigation = True
-                
+                self._flag_brute_force(event, len(recent_failures))
+    
+    def _apply_process_rules_batch(self, events: List[SecurityEvent]):
+        """Apply malware process rules to a batch of suspicious_process events"""
+        for event in events:
+            self._match_process_patterns(event)
+    
+    def _apply_failed_login_rules_batch(self, events: List[SecurityEvent]):
+        """Apply brute force rules to a batch of failed_login events
+        
+        Recent failures per source IP are counted from the history once and
+        then kept up to date as each event in the batch is added.
+        """
+        now = datetime.now()
+        failures = defaultdict(int)
+        for e in self.event_history:
+            if e.event_type == "failed_login" and (now - e.timestamp).total_seconds() < 300:
+                failures[e.source_ip] += 1
+        
+        for event in events:
+            if (now - event.timestamp).total_seconds() < 300:
+                failures[event.source_ip] += 1
+            
+            if failures[event.source_ip] >= 5:  # Threshold for brute force
+                self._flag_brute_force(event, failures[event.source_ip])
+    
+    def _match_process_patterns(self, event: SecurityEvent):
+        """Check a process event against the malware process patterns"""
+        process_name = event.event_data.get("process_name", "").lower()
+        
+        for pattern, compiled in self.process_patterns:
+            if compiled.search(process_name):
                 indicator = ThreatIndicator(
-                    id=f"brute_force_{event.source_ip}_{int(time.time())}",
-                    type="brute_force_attempt",
-                    value=event.source_ip,
+                    id=f"malware_pattern_{int(time.time())}",
+                    type="process_pattern",
+                    value=pattern,
                     source="rule_engine",
-                    confidence=0.9,
+                    confidence=0.8,
                     timestamp=datetime.now(),
-                    metadata={"failure_count": len(recent_failures)},
+                    metadata={"event_id": event.id, "process_name": process_name},
                     severity=ThreatLevel.HIGH,
-                    category=ThreatCategory.NETWORK_INTRUSION
+                    category=ThreatCategory.MALWARE
                 )
                 event.threat_indicators.append(indicator)
+                event.risk_score = max(event.risk_score, 0.8)
+    
+    def _flag_brute_force(self, event: SecurityEvent, failure_count: int):
+        """Mark a failed login event as part of a brute force attempt"""
+        event.risk_score = 0.7
+        event.requires_investigation = True
+        
+        indicator = ThreatIndicator(
+            id=f"brute_force_{event.source_ip}_{int(time.time())}",
+            type="brute_force_attempt",
+            value=event.source_ip,
+            source="rule_engine",
+            confidence=0.9,
+            timestamp=datetime.now(),
+            metadata={"failure_count": failure_count},
+            severity=ThreatLevel.HIGH,
+            category=ThreatCategory.NETWORK_INTRUSION
+        )
+        event.threat_indicators.append(indicator)
+    
+    def _index_threat_indicators(self) -> Tuple[Dict[str, List[ThreatIndicator]], List[ThreatIndicator]]:
+        """Split threat indicators into an IP lookup and a list of domains"""
+        ip_indicators = defaultdict(list)
+        domain_indicators = []
+        for indicator in list(self.threat_indicators.values()):
+            if indicator.type == "ip_address":
+                ip_indicators[indicator.value].append(indicator)
+            elif indicator.type == "domain":
+                domain_indicators.append(indicator)
+        return ip_indicators, domain_indicators
     
-    def _check_threat_indicators(self, event: SecurityEvent):
-        """Check security event against threat indicators"""
+    def _check_threat_indicators(self, event: SecurityEvent, indicator_index=None):
+        """Check security event against threat indicators
+        
+        indicator_index is the result of _index_threat_indicators, shared
+        across a batch; it is built for the single event when omitted.
+        """
+        ip_indicators, domain_indicators = indicator_index or self._index_threat_indicators()
+        
         # Check source IP against threat indicators
         if event.source_ip:
-            for indicator in self.threat_indicators.values():
-                if indicator.type == "ip_address" and indicator.value == event.source_ip:
-                    event.threat_indicators.append(indicator)
-                    event.risk_score = max(event.risk_score, indicator.confidence)
+            for indicator in ip_indicators.get(event.source_ip, ()):
+                event.threat_indicators.append(indicator)
+                event.risk_score = max(event.risk_score, indicator.confidence)
         
         # Check event data for other indicators
+        if not domain_indicators:
+            return
         event_data_str = json.dumps(event.event_data).lower()
-        for indicator in self.threat_indicators.values():
-            if indicator.type == "domain" and indicator.value.lower() in event_data_str:
+        for indicator in domain_indicators:
+            if indicator.value.lower() in event_data_str:
                 event.threat_indicators.append(indicator)
                 event.risk_score = max(event.risk_score, indicator.confidence)
     